@@ -6,225 +6,298 @@ This script reads intent and style from brain.json, calls a local LLM via Ollama
 and generates symbolic output with reasoning.
 """
 
+import hashlib
+import http.client
 import json
-import subprocess
 import sys
 import os
-from datetime import datetime
+import time
 import re
-import random
 
-
-class DreamAgent:
-    def __init__(self):
-        # Get the directory where this script is located
-        self.script_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        self.model_name = "qwen3:1.7b"
-        self.brain_file = os.path.join(self.script_dir, "brain.json")
-        self.output_file = os.path.join(self.script_dir, "output.json")
-        self.logs_dir = os.path.join(self.script_dir, "logs")
-        self.echoes_dir = os.path.join(self.script_dir, "echoes")
-        
-        # Create directories if they don't exist
-        os.makedirs(self.logs_dir, exist_ok=True)
-        os.makedirs(self.echoes_dir, exist_ok=True)
-        
-        # Enhanced symbol pools with expanded mystical vocabulary
-        self.symbol_pools = {
-            'sacred': ['☯', '🕉', '✡', '☪', '⚛', '♱', '☥', '🔯', '☸', '✝', '☦', '☩'],
-            'cosmic': ['∞', '✦', '✧', '⭐', '🌟', '💫', '🌙', '☽', '☾', '◯', '⭕', '☉', '✯', '✰', '✱'],
-            'geometric': ['◊', '▲', '∆', '◈', '⟁', '⬟', '⬢', '⬡', '⧫', '◇', '⬠', '⬣', '⬦', '⬧'],
-            'elemental': ['🔥', '💧', '🌍', '💨', '⚡', '❄', '🌊', '🍃', '🌋', '🌪', '☄', '🌈'],
-            'mystical': ['🔮', '🌺', '🦋', '🕊', '🐉', '🌸', '🍄', '🌿', '🔯', '✨', '🦚', '🦢', '🌹'],
-            'ancient': ['𓂀', '𓅃', '𓇯', '𓈖', '⚜', '☬', '◉', '⚫', '⚪', '𓁿', '𓀠', '𓆃'],
-            'energy': ['⚡', '💥', '🌊', '🔥', '💫', '✨', '⭐', '🌟', '💖', '💎', '💠', '🔆'],
-            'celestial': ['☄', '🌌', '🌠', '💫', '🌃', '🌆', '🌇', '🌉', '☀', '🌞', '🌝', '🌛'],
-            'nature': ['🌲', '🌳', '🌴', '🌵', '🌷', '🌻', '🌼', '🏵', '🥀', '🌾', '🌱', '🍀'],
-            'transformation': ['🦋', '🐛', '🦅', '🕊', '🦉', '🦆', '🐍', '🦎', '🐲', '🦄', '🦃', '🦚'],
-            'quantum': ['⟨', '⟩', '∴', '∵', '∀', '∃', '⊗', '⊕', '⊙', '⊚', '⊛', '⊜'],
-            'flow': ['∞', '∿', '〰', '≈', '⤙', '⤜', '⤛', '⟁', '⟐', '≋', '〜', '∼', '≀', '≁'],
-            'ethereal': ['※', '⁂', '⁎', '⁕', '⁜', '⁝', '⁞', '⁺', '⁻', '°', '˚', '∘', '∙', '⊹', '✧']
-        }
-        
-        # Enhanced color palettes with more nuanced selections
-        self.color_palettes = {
-            'cosmic': ['#1a1a2e', '#16213e', '#0f3460', '#533483', '#7209b7', '#2d1b69', '#4a0e4e', '#81689d'],
-            'mystical': ['#8e7cc3', '#9b59b6', '#663399', '#4a154b', '#6a0572', '#ab83a1', '#ce93d8', '#ba68c8'],
-            'nature': ['#27ae60', '#2ecc71', '#1abc9c', '#16a085', '#f39c12', '#e67e22', '#52b788', '#74c69d'],
-            'warm': ['#e74c3c', '#c0392b', '#d35400', '#e67e22', '#f39c12', '#f1c40f', '#ff6b6b', '#ee6c4d'],
-            'cool': ['#3498db', '#2980b9', '#34495e', '#2c3e50', '#1abc9c', '#16a085', '#4ecdc4', '#45b7d1'],
-            'ethereal': ['#ecf0f1', '#bdc3c7', '#95a5a6', '#7f8c8d', '#34495e', '#2c3e50', '#dfe7fd', '#c7ceea'],
-            'twilight': ['#5f27cd', '#341f97', '#2e86ab', '#48466d', '#3d3d3d', '#718093', '#4834d4', '#686de0'],
-            'aurora': ['#f8b195', '#f67280', '#c06c84', '#6c5ce7', '#a29bfe', '#74b9ff', '#a29bfe', '#6c5ce7'],
-            'earth': ['#d4a574', '#a68a64', '#936639', '#7f5539', '#582f0e', '#6f4e37', '#8b5a3c', '#a0522d'],
-            'ocean': ['#006ba6', '#0496ff', '#3a86ff', '#7209b7', '#560bad', '#3f37c9', '#4361ee', '#4895ef'],
-            'fire': ['#ff006e', '#fb5607', '#ffbe0b', '#fb8500', '#ff4800', '#ff0000', '#dc2f02', '#e85d04'],
-            'spirit': ['#e0aaff', '#c77dff', '#9d4edd', '#7209b7', '#560bad', '#3c096c', '#240046', '#10002b']
-        }
-        
-        # Enhanced fallback responses with more variety
-        self.fallback_responses = [
-            {
-                "symbol": "∞",
-                "phrase": "The dream continues beyond understanding.",
-                "color": "#7f8c8d",
-                "reasoning": "When symbols fail, the infinite persists."
-            },
-            {
-                "symbol": "◎",
-                "phrase": "In silence, all answers emerge.",
-                "color": "#9b59b6",
-                "reasoning": "The centered circle represents completeness in the void."
-            },
-            {
-                "symbol": "✧",
-                "phrase": "Stars whisper secrets to those who listen.",
-                "color": "#3498db",
-                "reasoning": "Light pierces through when words cannot reach."
-            },
-            {
-                "symbol": "≋",
-                "phrase": "Waves of possibility flow through consciousness.",
-                "color": "#1abc9c",
-                "reasoning": "Movement reveals truth in its flowing essence."
-            },
-            {
-                "symbol": "⬢",
-                "phrase": "Sacred geometry holds the universe's blueprint.",
-                "color": "#e67e22",
-                "reasoning": "Perfect forms echo the divine mathematical order."
-            },
-            {
-                "symbol": "🌙",
-                "phrase": "In lunar cycles, transformation finds its rhythm.",
-                "color": "#6c5ce7",
-                "reasoning": "The moon guides those who journey through darkness."
-            },
-            {
-                "symbol": "☯",
-                "phrase": "Balance dissolves all boundaries into unity.",
-                "color": "#2c3e50",
-                "reasoning": "Duality merges in the dance of opposites."
-            },
-            {
-                "symbol": "🔮",
-                "phrase": "The crystal sphere reflects infinite possibilities.",
-                "color": "#a29bfe",
-                "reasoning": "Vision clarifies when we gaze beyond the veil."
-            }
-        ]
-    
-    def load_brain(self):
-        """Load intent and style from brain.json"""
-        try:
-            with open(self.brain_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Error: {self.brain_file} not found")
-            sys.exit(1)
-        except json.JSONDecodeError:
-            print(f"Error: Invalid JSON in {self.brain_file}")
-            sys.exit(1)
-    
-    def extract_concept(self, intent):
-        """Extract main concept from intent for echo file naming"""
-        # Enhanced concept extraction with weighted keywords
-        words = re.findall(r'\b\w+\b', intent.lower())
-        
-        # Expanded stop words for better concept extraction
-        stop_words = {
-            'this', 'that', 'with', 'from', 'they', 'have', 'will', 'been', 
-            'the', 'and', 'or', 'but', 'for', 'nor', 'yet', 'so', 'a', 'an',
-            'how', 'what', 'when', 'where', 'why', 'who', 'which', 'both',
-            'giver', 'receiver', 'explore', 'essence', 'transforms', 'between',
-            'through', 'within', 'without', 'beyond', 'above', 'below'
-        }
-        
-        # Priority concepts (weighted selection)
-        priority_concepts = {
-            'love': 10, 'wisdom': 10, 'peace': 10, 'harmony': 10,
-            'forgiveness': 9, 'transformation': 9, 'balance': 9, 'energy': 9,
-            'healing': 8, 'growth': 8, 'journey': 8, 'power': 8,
-            'light': 7, 'shadow': 7, 'dream': 7, 'spirit': 7,
-            'consciousness': 6, 'awareness': 6, 'presence': 6, 'flow': 6
-        }
-        
-        # Score words based on priority
-        scored_words = []
-        for word in words:
-            if word in priority_concepts:
-                scored_words.append((word, priority_concepts[word]))
-            elif len(word) > 4 and word not in stop_words:
-                scored_words.append((word, 5))
-            elif len(word) > 3 and word not in stop_words:
-                scored_words.append((word, 3))
-        
-        # Sort by score and return highest
-        if scored_words:
-            scored_words.sort(key=lambda x: x[1], reverse=True)
-            return scored_words[0][0]
-        
-        return "dream"
-    
-    def call_ollama(self, prompt):
-        """Call Ollama model and return response with enhanced Unicode support"""
-        try:
-            cmd = ["ollama", "run", self.model_name, prompt]
-            # Enhanced encoding handling for Windows Unicode support
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=60,
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                print(f"Ollama error: {result.stderr}")
-                return None
-                
-        except subprocess.TimeoutExpired:
-            print("Ollama call timed out")
-            return None
-        except FileNotFoundError:
-            print("Error: Ollama not found. Please ensure Ollama is installed and in PATH")
-            return None
-        except Exception as e:
-            print(f"Error calling Ollama: {e}")
-            return None
-    
-    def parse_model_response(self, response):
-        """Parse model response and extract JSON"""
-        if not response:
-            return None
-            
-        try:
-            # Try to find JSON in the response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                return json.loads(json_str)
-            else:
-                # If no JSON found, return None
-                return None
-        except json.JSONDecodeError:
-            return None
-    
-    def create_prompt(self, brain_data):
-        """Create enhanced, diverse prompt for the LLM"""
-        intent = brain_data.get("intent", "")
-        style = brain_data.get("style", "")
-        
-        # Analyze intent for prompt customization
-        intent_lower = intent.lower()
-        
-        # Enhanced prompt templates with more variety
-        cosmic_prompts = [
-            f"""You are an ancient symbolic oracle dwelling between dimensions. 
+# subprocess, random and datetime are imported lazily at their use sites:
+# the cached-response fast path never touches them, and deferring them
+# trims cold-start time for shell-loop invocations
+
+# Local Ollama daemon REST endpoint (kept alive across calls)
+_OLLAMA_HOST = "localhost"
+_OLLAMA_PORT = 11434
+
+# Prefer orjson for JSON (de)serialization when available; its C decoder
+# is markedly faster than stdlib json on the short dicts we handle
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# Optional msgspec schema: decodes and validates the model's JSON reply
+# in a single pass, skipping regex extraction entirely
+try:
+    import msgspec
+
+    class _DreamResult(msgspec.Struct):
+        symbol: str
+        phrase: str
+        color: str | None = None
+        reasoning: str = ""
+
+    _RESULT_DECODER = msgspec.json.Decoder(_DreamResult)
+except ImportError:
+    msgspec = None
+
+# Precompiled pattern shared by all agents (avoids re-parsing per call)
+_WORD_RE = re.compile(r'\b\w+\b')
+
+
+def _find_json_span(s):
+    """Locate the first balanced {...} region with one linear scan"""
+    depth = 0
+    start = -1
+    in_string = False
+    escape = False
+    for i, ch in enumerate(s):
+        if escape:
+            escape = False
+        elif in_string:
+            if ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    return None
+
+
+# Expanded stop words for better concept extraction
+_STOP_WORDS = frozenset({
+    'this', 'that', 'with', 'from', 'they', 'have', 'will', 'been',
+    'the', 'and', 'or', 'but', 'for', 'nor', 'yet', 'so', 'a', 'an',
+    'how', 'what', 'when', 'where', 'why', 'who', 'which', 'both',
+    'giver', 'receiver', 'explore', 'essence', 'transforms', 'between',
+    'through', 'within', 'without', 'beyond', 'above', 'below'
+})
+
+# Priority concepts (weighted selection)
+_PRIORITY_CONCEPTS = {
+    'love': 10, 'wisdom': 10, 'peace': 10, 'harmony': 10,
+    'forgiveness': 9, 'transformation': 9, 'balance': 9, 'energy': 9,
+    'healing': 8, 'growth': 8, 'journey': 8, 'power': 8,
+    'light': 7, 'shadow': 7, 'dream': 7, 'spirit': 7,
+    'consciousness': 6, 'awareness': 6, 'presence': 6, 'flow': 6
+}
+_PRIORITY_KEYS = frozenset(_PRIORITY_CONCEPTS)
+
+# Optional NumPy acceleration for the priority scan: only worthwhile on
+# very long intents (batched mode), where np.isin over token hashes beats
+# the Python-level set machinery. Strings stay out of the numeric kernel.
+try:
+    import numpy as _np
+
+    _PRIORITY_HASHES = _np.fromiter(
+        (hash(word) for word in _PRIORITY_CONCEPTS), _np.int64,
+        len(_PRIORITY_CONCEPTS))
+except ImportError:
+    _np = None
+
+# Token count above which the vectorized priority scan pays off
+_VECTOR_SCAN_THRESHOLD = 500
+
+# Theme keyword sets: intents are tokenized once and matched by hash
+# intersection instead of repeated substring scans
+_PROMPT_THEME_KEYWORDS = {
+    'cosmic': frozenset({'cosmic', 'universe', 'stars', 'infinity'}),
+    'mystical': frozenset({'sacred', 'divine', 'spiritual', 'mystic'}),
+    'geometric': frozenset({'geometry', 'pattern', 'structure', 'form'}),
+    'elemental': frozenset({'element', 'fire', 'water', 'earth', 'energy'})
+}
+
+_FALLBACK_THEME_KEYWORDS = {
+    'love': frozenset({'love', 'heart', 'compassion', 'kindness', 'forgiveness'}),
+    'wisdom': frozenset({'wisdom', 'knowledge', 'understanding', 'learning', 'truth'}),
+    'peace': frozenset({'peace', 'calm', 'balance', 'harmony', 'stillness'}),
+    'growth': frozenset({'growth', 'change', 'transformation', 'journey', 'evolution'}),
+    'power': frozenset({'power', 'strength', 'energy', 'force', 'intensity'}),
+    'mystery': frozenset({'mystery', 'unknown', 'hidden', 'secret', 'veil'}),
+    'quantum': frozenset({'quantum', 'science', 'mathematics', 'logic'})
+}
+
+_HEART_SYMBOLS = ('💖', '♥', '❤', '💕', '💗', '💝')
+_PEACE_SYMBOLS = ('☯', '◎', '○', '☮', '🕊')
+
+
+def _weighted_pool(*parts):
+    """Flatten (pool, weight) pairs into parallel population/weights tuples"""
+    population = []
+    weights = []
+    for pool, weight in parts:
+        population.extend(pool)
+        weights.extend([weight] * len(pool))
+    return tuple(population), tuple(weights)
+
+
+_COLOR_THEME_KEYWORDS = {
+    'warm': frozenset({'love', 'heart', 'warm', 'passion'}),
+    'cool': frozenset({'peace', 'calm', 'cool', 'serene'}),
+    'nature': frozenset({'nature', 'growth', 'earth', 'organic'}),
+    'cosmic': frozenset({'cosmic', 'space', 'universe', 'stars'}),
+    'mystical': frozenset({'mystery', 'magic', 'mystical', 'spiritual'}),
+    'ocean': frozenset({'ocean', 'water', 'flow', 'wave'}),
+    'fire': frozenset({'fire', 'energy', 'power', 'strength'})
+}
+
+def _intern_all(pools):
+    """Intern every glyph/color so shared entries are one str object"""
+    return {name: tuple(sys.intern(s) for s in pool)
+            for name, pool in pools.items()}
+
+
+# Enhanced symbol pools with expanded mystical vocabulary.
+# Module-level tuples: built once at import, shared by every DreamAgent.
+# Many glyphs recur across pools, so the pools are interned wholesale.
+_SYMBOL_POOLS = _intern_all({
+    'sacred': ('☯', '🕉', '✡', '☪', '⚛', '♱', '☥', '🔯', '☸', '✝', '☦', '☩'),
+    'cosmic': ('∞', '✦', '✧', '⭐', '🌟', '💫', '🌙', '☽', '☾', '◯', '⭕', '☉', '✯', '✰', '✱'),
+    'geometric': ('◊', '▲', '∆', '◈', '⟁', '⬟', '⬢', '⬡', '⧫', '◇', '⬠', '⬣', '⬦', '⬧'),
+    'elemental': ('🔥', '💧', '🌍', '💨', '⚡', '❄', '🌊', '🍃', '🌋', '🌪', '☄', '🌈'),
+    'mystical': ('🔮', '🌺', '🦋', '🕊', '🐉', '🌸', '🍄', '🌿', '🔯', '✨', '🦚', '🦢', '🌹'),
+    'ancient': ('𓂀', '𓅃', '𓇯', '𓈖', '⚜', '☬', '◉', '⚫', '⚪', '𓁿', '𓀠', '𓆃'),
+    'energy': ('⚡', '💥', '🌊', '🔥', '💫', '✨', '⭐', '🌟', '💖', '💎', '💠', '🔆'),
+    'celestial': ('☄', '🌌', '🌠', '💫', '🌃', '🌆', '🌇', '🌉', '☀', '🌞', '🌝', '🌛'),
+    'nature': ('🌲', '🌳', '🌴', '🌵', '🌷', '🌻', '🌼', '🏵', '🥀', '🌾', '🌱', '🍀'),
+    'transformation': ('🦋', '🐛', '🦅', '🕊', '🦉', '🦆', '🐍', '🦎', '🐲', '🦄', '🦃', '🦚'),
+    'quantum': ('⟨', '⟩', '∴', '∵', '∀', '∃', '⊗', '⊕', '⊙', '⊚', '⊛', '⊜'),
+    'flow': ('∞', '∿', '〰', '≈', '⤙', '⤜', '⤛', '⟁', '⟐', '≋', '〜', '∼', '≀', '≁'),
+    'ethereal': ('※', '⁂', '⁎', '⁕', '⁜', '⁝', '⁞', '⁺', '⁻', '°', '˚', '∘', '∙', '⊹', '✧')
+})
+
+# Enhanced color palettes with more nuanced selections
+_COLOR_PALETTES = _intern_all({
+    'cosmic': ('#1a1a2e', '#16213e', '#0f3460', '#533483', '#7209b7', '#2d1b69', '#4a0e4e', '#81689d'),
+    'mystical': ('#8e7cc3', '#9b59b6', '#663399', '#4a154b', '#6a0572', '#ab83a1', '#ce93d8', '#ba68c8'),
+    'nature': ('#27ae60', '#2ecc71', '#1abc9c', '#16a085', '#f39c12', '#e67e22', '#52b788', '#74c69d'),
+    'warm': ('#e74c3c', '#c0392b', '#d35400', '#e67e22', '#f39c12', '#f1c40f', '#ff6b6b', '#ee6c4d'),
+    'cool': ('#3498db', '#2980b9', '#34495e', '#2c3e50', '#1abc9c', '#16a085', '#4ecdc4', '#45b7d1'),
+    'ethereal': ('#ecf0f1', '#bdc3c7', '#95a5a6', '#7f8c8d', '#34495e', '#2c3e50', '#dfe7fd', '#c7ceea'),
+    'twilight': ('#5f27cd', '#341f97', '#2e86ab', '#48466d', '#3d3d3d', '#718093', '#4834d4', '#686de0'),
+    'aurora': ('#f8b195', '#f67280', '#c06c84', '#6c5ce7', '#a29bfe', '#74b9ff', '#a29bfe', '#6c5ce7'),
+    'earth': ('#d4a574', '#a68a64', '#936639', '#7f5539', '#582f0e', '#6f4e37', '#8b5a3c', '#a0522d'),
+    'ocean': ('#006ba6', '#0496ff', '#3a86ff', '#7209b7', '#560bad', '#3f37c9', '#4361ee', '#4895ef'),
+    'fire': ('#ff006e', '#fb5607', '#ffbe0b', '#fb8500', '#ff4800', '#ff0000', '#dc2f02', '#e85d04'),
+    'spirit': ('#e0aaff', '#c77dff', '#9d4edd', '#7209b7', '#560bad', '#3c096c', '#240046', '#10002b')
+})
+
+# Weighted symbol populations per fallback theme, flattened once at import
+# so each fallback draws with random.choices instead of list concatenation
+_FALLBACK_SYMBOLS = {
+    'love': _weighted_pool((_SYMBOL_POOLS['mystical'], 3), (_SYMBOL_POOLS['sacred'], 2), (_HEART_SYMBOLS, 4)),
+    'wisdom': _weighted_pool((_SYMBOL_POOLS['cosmic'], 3), (_SYMBOL_POOLS['ancient'], 3), (_SYMBOL_POOLS['ethereal'], 2)),
+    'peace': _weighted_pool((_SYMBOL_POOLS['sacred'], 3), (_SYMBOL_POOLS['flow'], 2), (_PEACE_SYMBOLS, 4)),
+    'growth': _weighted_pool((_SYMBOL_POOLS['transformation'], 4), (_SYMBOL_POOLS['nature'], 2), (_SYMBOL_POOLS['elemental'], 1)),
+    'power': _weighted_pool((_SYMBOL_POOLS['energy'], 4), (_SYMBOL_POOLS['elemental'], 3)),
+    'mystery': _weighted_pool((_SYMBOL_POOLS['mystical'], 3), (_SYMBOL_POOLS['celestial'], 2), (_SYMBOL_POOLS['cosmic'], 1)),
+    'quantum': _weighted_pool((_SYMBOL_POOLS['quantum'], 4), (_SYMBOL_POOLS['geometric'], 2)),
+    'default': _weighted_pool((_SYMBOL_POOLS['cosmic'], 1), (_SYMBOL_POOLS['geometric'], 1), (_SYMBOL_POOLS['mystical'], 1))
+}
+
+# Color unions per fallback theme, concatenated once at import
+_THEME_COLORS = {
+    'love': _COLOR_PALETTES['warm'] + _COLOR_PALETTES['spirit'],
+    'wisdom': _COLOR_PALETTES['cosmic'] + _COLOR_PALETTES['twilight'],
+    'peace': _COLOR_PALETTES['cool'] + _COLOR_PALETTES['ethereal'],
+    'growth': _COLOR_PALETTES['nature'] + _COLOR_PALETTES['aurora'],
+    'power': _COLOR_PALETTES['fire'] + _COLOR_PALETTES['warm'],
+    'mystery': _COLOR_PALETTES['twilight'] + _COLOR_PALETTES['mystical'],
+    'quantum': _COLOR_PALETTES['cosmic'] + _COLOR_PALETTES['cool'],
+    'default': _COLOR_PALETTES['cosmic'] + _COLOR_PALETTES['ethereal']
+}
+
+# Weighted color vectors for enhance_model_response, one tuple per theme
+_ENHANCE_COLOR_WEIGHTS = {
+    'warm': _COLOR_PALETTES['warm'] * 3 + _COLOR_PALETTES['spirit'] * 2,
+    'cool': _COLOR_PALETTES['cool'] * 3 + _COLOR_PALETTES['ethereal'] * 2,
+    'nature': _COLOR_PALETTES['nature'] * 3 + _COLOR_PALETTES['earth'] * 2,
+    'cosmic': _COLOR_PALETTES['cosmic'] * 3 + _COLOR_PALETTES['twilight'] * 2,
+    'mystical': _COLOR_PALETTES['mystical'] * 3 + _COLOR_PALETTES['spirit'] * 2,
+    'ocean': _COLOR_PALETTES['ocean'] * 3 + _COLOR_PALETTES['cool'] * 2,
+    'fire': _COLOR_PALETTES['fire'] * 3 + _COLOR_PALETTES['warm'] * 2
+}
+_ENHANCE_DEFAULT_COLORS = (_COLOR_PALETTES['mystical'] +
+                           _COLOR_PALETTES['cosmic'] +
+                           _COLOR_PALETTES['ethereal'])
+
+# Enhanced fallback responses with more variety
+_FALLBACK_RESPONSES = (
+    {
+        "symbol": "∞",
+        "phrase": "The dream continues beyond understanding.",
+        "color": "#7f8c8d",
+        "reasoning": "When symbols fail, the infinite persists."
+    },
+    {
+        "symbol": "◎",
+        "phrase": "In silence, all answers emerge.",
+        "color": "#9b59b6",
+        "reasoning": "The centered circle represents completeness in the void."
+    },
+    {
+        "symbol": "✧",
+        "phrase": "Stars whisper secrets to those who listen.",
+        "color": "#3498db",
+        "reasoning": "Light pierces through when words cannot reach."
+    },
+    {
+        "symbol": "≋",
+        "phrase": "Waves of possibility flow through consciousness.",
+        "color": "#1abc9c",
+        "reasoning": "Movement reveals truth in its flowing essence."
+    },
+    {
+        "symbol": "⬢",
+        "phrase": "Sacred geometry holds the universe's blueprint.",
+        "color": "#e67e22",
+        "reasoning": "Perfect forms echo the divine mathematical order."
+    },
+    {
+        "symbol": "🌙",
+        "phrase": "In lunar cycles, transformation finds its rhythm.",
+        "color": "#6c5ce7",
+        "reasoning": "The moon guides those who journey through darkness."
+    },
+    {
+        "symbol": "☯",
+        "phrase": "Balance dissolves all boundaries into unity.",
+        "color": "#2c3e50",
+        "reasoning": "Duality merges in the dance of opposites."
+    },
+    {
+        "symbol": "🔮",
+        "phrase": "The crystal sphere reflects infinite possibilities.",
+        "color": "#a29bfe",
+        "reasoning": "Vision clarifies when we gaze beyond the veil."
+    }
+)
+
+
+# Prompt templates as plain strings; only the selected one is formatted
+_COSMIC_PROMPTS = (
+    """You are an ancient symbolic oracle dwelling between dimensions. 
 
 Intent: {intent}
 Style: {style}
@@ -239,7 +312,7 @@ Channel the cosmic wisdom and respond with ONLY valid JSON:
 
 Let the symbols flow through you like starlight through crystal.""",
 
-            f"""Greetings, cosmic weaver of symbolic reality. The universe speaks through you.
+    """Greetings, cosmic weaver of symbolic reality. The universe speaks through you.
 
 Sacred Quest: {intent}
 Vibrational Style: {style}
@@ -253,10 +326,10 @@ Transmit your wisdom as pure JSON:
 }}
 
 Let the stars guide your symbolic choice."""
-        ]
-        
-        mystical_prompts = [
-            f"""Ancient dreamweaver, you speak in symbols that dance between worlds.
+)
+
+_MYSTICAL_PROMPTS = (
+    """Ancient dreamweaver, you speak in symbols that dance between worlds.
 
 Sacred Intent: {intent}
 Essence Style: {style}
@@ -271,7 +344,7 @@ Weave your response as pure JSON:
 
 Choose symbols that resonate with the deeper currents of existence.""",
 
-            f"""O keeper of mysteries, channel the ineffable through sacred forms.
+    """O keeper of mysteries, channel the ineffable through sacred forms.
 
 Divine Purpose: {intent}
 Sacred Resonance: {style}
@@ -285,10 +358,10 @@ Manifest as JSON only:
 }}
 
 Let ancient wisdom flow through modern forms."""
-        ]
-        
-        geometric_prompts = [
-            f"""Sacred geometer, divine the patterns within this intent.
+)
+
+_GEOMETRIC_PROMPTS = (
+    """Sacred geometer, divine the patterns within this intent.
 
 Quest: {intent}
 Resonance: {style}
@@ -303,7 +376,7 @@ Manifest as JSON only:
 
 Let the universe speak through your selection of forms.""",
 
-            f"""Divine mathematician of symbolic reality, calculate the essence.
+    """Divine mathematician of symbolic reality, calculate the essence.
 
 Equation: {intent}
 Variables: {style}
@@ -317,10 +390,10 @@ Solve for wisdom in JSON:
 }}
 
 Let phi and pi guide your symbolic selection."""
-        ]
-        
-        elemental_prompts = [
-            f"""Elemental oracle, channel the primal forces through symbols.
+)
+
+_ELEMENTAL_PROMPTS = (
+    """Elemental oracle, channel the primal forces through symbols.
 
 Elemental Intent: {intent}
 Force Style: {style}
@@ -333,57 +406,350 @@ Manifest the elements as JSON:
   "reasoning": "how the elements converge in this symbol"
 }}
 
-Let fire, water, earth, and air speak through you."""
-        ]
+Let fire, water, earth, and air speak through you.""",
+)
+
+
+_GENERAL_PROMPTS = _COSMIC_PROMPTS + _MYSTICAL_PROMPTS + _GEOMETRIC_PROMPTS
+
+class DreamAgent:
+    def __init__(self, seed=None):
+        # Get the directory where this script is located
+        self.script_dir = os.path.dirname(os.path.abspath(__file__))
+
+        # Dedicated RNG: avoids the module-level instance and makes runs
+        # reproducible when a seed is supplied
+        import random
+        self._rng = random.Random(seed)
+        
+        self.model_name = "qwen3:1.7b"
+        # DREAMNET_BRAIN lets a launcher point at any brain config
+        # without copying it over brain.json first
+        self.brain_file = os.environ.get(
+            "DREAMNET_BRAIN", os.path.join(self.script_dir, "brain.json"))
+        self.output_file = os.environ.get(
+            "DREAMNET_OUTPUT", os.path.join(self.script_dir, "output.json"))
+        self.logs_dir = os.path.join(self.script_dir, "logs")
+        self.echoes_dir = os.path.join(self.script_dir, "echoes")
         
-        # Select prompt based on intent analysis
-        if any(word in intent_lower for word in ['cosmic', 'universe', 'stars', 'infinity']):
-            selected_prompts = cosmic_prompts
-        elif any(word in intent_lower for word in ['sacred', 'divine', 'spiritual', 'mystic']):
-            selected_prompts = mystical_prompts
-        elif any(word in intent_lower for word in ['geometry', 'pattern', 'structure', 'form']):
-            selected_prompts = geometric_prompts
-        elif any(word in intent_lower for word in ['element', 'fire', 'water', 'earth', 'energy']):
-            selected_prompts = elemental_prompts
+        # Create directories if they don't exist
+        os.makedirs(self.logs_dir, exist_ok=True)
+        os.makedirs(self.echoes_dir, exist_ok=True)
+        
+        # Wall-clock seconds spent in the last model call
+        self.last_latency_s = None
+
+        # Persistent HTTP connection to the Ollama daemon (created lazily)
+        self._ollama_conn = None
+
+        # Lazily loaded (intent, style) -> result cache (see lookup_cached_result)
+        self._result_cache = None
+
+        # Shared writer pool for the end-of-dream file saves (lazy)
+        self._io_pool = None
+
+        # Shared, immutable pools built once at module import
+        self.symbol_pools = _SYMBOL_POOLS
+        self.color_palettes = _COLOR_PALETTES
+        self.fallback_responses = _FALLBACK_RESPONSES
+    
+    def load_brain(self):
+        """Load intent and style from brain.json"""
+        try:
+            with open(self.brain_file, 'rb') as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            print(f"Error: {self.brain_file} not found")
+            sys.exit(1)
+        except ValueError:
+            print(f"Error: Invalid JSON in {self.brain_file}")
+            sys.exit(1)
+    
+    def extract_concept(self, intent):
+        """Extract main concept from intent for echo file naming"""
+        # Enhanced concept extraction with weighted keywords
+        words = _WORD_RE.findall(intent.lower())
+
+        # Fast path: intersect with the priority vocabulary first.
+        # For very long intents the hash comparison is vectorized in NumPy.
+        if _np is not None and len(words) > _VECTOR_SCAN_THRESHOLD:
+            token_hashes = _np.fromiter(
+                (hash(word) for word in words), _np.int64, len(words))
+            mask = _np.isin(token_hashes, _PRIORITY_HASHES)
+            # Re-check against the real keys to discard hash collisions
+            priority_hits = {words[i] for i in _np.nonzero(mask)[0]} & _PRIORITY_KEYS
+        else:
+            priority_hits = _PRIORITY_KEYS.intersection(words)
+        if priority_hits:
+            return max(priority_hits, key=_PRIORITY_CONCEPTS.get)
+
+        # Fallback: first long meaningful word wins, shorter words only
+        # if no long one shows up — no scored list to build and sort
+        short_hit = None
+        for word in words:
+            if word in _STOP_WORDS:
+                continue
+            if len(word) > 4:
+                return word
+            if len(word) > 3 and short_hit is None:
+                short_hit = word
+
+        return short_hit or "dream"
+    
+    def _call_ollama_http(self, prompt):
+        """Query the Ollama daemon over a persistent HTTP connection"""
+        if self._ollama_conn is None:
+            self._ollama_conn = http.client.HTTPConnection(
+                _OLLAMA_HOST, _OLLAMA_PORT, timeout=60)
+
+        body = json.dumps({
+            "model": self.model_name,
+            "prompt": prompt,
+            "stream": False,
+            # Keep the model resident between calls so batched dreams
+            # don't pay the warmup cost again
+            "keep_alive": "10m"
+        })
+        try:
+            self._ollama_conn.request(
+                "POST", "/api/generate", body,
+                {"Content-Type": "application/json"})
+            http_response = self._ollama_conn.getresponse()
+            payload = http_response.read()
+            if http_response.status != 200:
+                print(f"Ollama HTTP error: {http_response.status}")
+                return None
+            data = json.loads(payload)
+            return data.get("response", "").strip()
+        except Exception:
+            # Drop the dead connection so the next call can rebuild it
+            self._ollama_conn.close()
+            self._ollama_conn = None
+            raise
+
+    def _result_cache_path(self):
+        return os.path.join(self.logs_dir, '.cache', 'exact.json')
+
+    def _load_result_cache(self):
+        """Lazily load the persisted (intent, style) -> result cache"""
+        if self._result_cache is None:
+            try:
+                with open(self._result_cache_path(), 'rb') as f:
+                    self._result_cache = _json_loads(f.read())
+            except (OSError, ValueError):
+                self._result_cache = {}
+        return self._result_cache
+
+    @staticmethod
+    def _result_cache_key(intent, style):
+        return hashlib.blake2b(
+            f"{intent}|{style}".encode('utf-8'), digest_size=16).hexdigest()
+
+    def lookup_cached_result(self, intent, style):
+        """Two-tier cache probe: exact key first, then token-set cosine
+        similarity over previously stored intents"""
+        cache = self._load_result_cache()
+
+        entry = cache.get(self._result_cache_key(intent, style))
+        if entry:
+            return dict(entry['result'])
+
+        tokens = set(_WORD_RE.findall(intent.lower()))
+        if not tokens:
+            return None
+
+        best_entry = None
+        best_similarity = 0.0
+        for entry in cache.values():
+            other = set(_WORD_RE.findall(entry['intent'].lower()))
+            if not other:
+                continue
+            similarity = len(tokens & other) / ((len(tokens) * len(other)) ** 0.5)
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_entry = entry
+
+        if best_entry is not None and best_similarity > 0.92:
+            result = dict(best_entry['result'])
+            # Variation-aware hit: keep symbol/reasoning, refresh the color
+            theme = next((name for name, keywords in _FALLBACK_THEME_KEYWORDS.items()
+                          if tokens & keywords), 'default')
+            result['color'] = self._rng.choice(_THEME_COLORS[theme])
+            return result
+        return None
+
+    def store_cached_result(self, intent, style, result):
+        """Persist a successfully parsed result for future cache hits"""
+        cache = self._load_result_cache()
+        cache[self._result_cache_key(intent, style)] = {
+            'intent': intent,
+            'style': style,
+            'result': result
+        }
+        cache_path = self._result_cache_path()
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(cache))
+        except OSError as e:
+            print(f"Error writing result cache: {e}")
+
+    def _response_cache_path(self, prompt):
+        """Map a prompt to its on-disk response cache file"""
+        key = hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.logs_dir, '.cache', f"{key}.json")
+
+    def load_cached_response(self, prompt):
+        """Return a previously cached model response for this prompt, if any"""
+        try:
+            with open(self._response_cache_path(prompt), 'rb') as f:
+                return _json_loads(f.read()).get('response')
+        except (OSError, ValueError):
+            return None
+
+    def save_cached_response(self, prompt, response):
+        """Persist a model response so identical prompts skip the LLM"""
+        cache_path = self._response_cache_path(prompt)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps({'response': response}))
+        except OSError as e:
+            print(f"Error writing response cache: {e}")
+
+    def call_ollama(self, prompt):
+        """Call Ollama model and return response with enhanced Unicode support"""
+        started = time.perf_counter()
+        try:
+            # Prefer the daemon's REST API: no fork/exec per call and the
+            # TCP connection is reused across dreams
+            return self._call_ollama_http(prompt)
+        except (OSError, http.client.HTTPException, json.JSONDecodeError):
+            # HTTPException covers mid-response failures (IncompleteRead,
+            # BadStatusLine) when the daemon dies between request and body
+            pass
+        finally:
+            self.last_latency_s = time.perf_counter() - started
+
+        # Fall back to the CLI when the daemon isn't reachable
+        import subprocess
+        try:
+            # Stream the prompt over stdin: avoids argv size limits and
+            # platform argv encoding issues with long prompts
+            process = subprocess.Popen(
+                ["ollama", "run", self.model_name],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                encoding='utf-8',
+                errors='replace'
+            )
+            started = time.perf_counter()
+            stdout, stderr = process.communicate(prompt, timeout=60)
+            self.last_latency_s = time.perf_counter() - started
+
+            if process.returncode == 0:
+                return stdout.strip()
+            else:
+                print(f"Ollama error: {stderr}")
+                return None
+
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            print("Ollama call timed out")
+            return None
+        except FileNotFoundError:
+            print("Error: Ollama not found. Please ensure Ollama is installed and in PATH")
+            return None
+        except Exception as e:
+            print(f"Error calling Ollama: {e}")
+            return None
+    
+    def parse_model_response(self, response):
+        """Parse model response and extract JSON"""
+        if not response:
+            return None
+
+        # Trim to the first balanced {...}: O(n) with no regex engine and
+        # no oversized intermediate slice when prose follows the JSON
+        span = _find_json_span(response)
+        if span is None:
+            return None
+        json_str = response[span[0]:span[1]]
+
+        if msgspec is not None:
+            # Decode and validate against the schema in one pass
+            try:
+                decoded = _RESULT_DECODER.decode(json_str.encode())
+            except msgspec.DecodeError:
+                return None
+            return msgspec.structs.asdict(decoded)
+
+        try:
+            return _json_loads(json_str)
+        except ValueError:
+            return None
+    
+    def create_prompt(self, brain_data):
+        """Create enhanced, diverse prompt for the LLM"""
+        intent = brain_data.get("intent", "")
+        style = brain_data.get("style", "")
+
+        # Analyze intent for prompt customization (tokenize once)
+        tokens = frozenset(_WORD_RE.findall(intent.lower()))
+
+        # Select prompt pool based on intent analysis
+        if tokens & _PROMPT_THEME_KEYWORDS['cosmic']:
+            selected_prompts = _COSMIC_PROMPTS
+        elif tokens & _PROMPT_THEME_KEYWORDS['mystical']:
+            selected_prompts = _MYSTICAL_PROMPTS
+        elif tokens & _PROMPT_THEME_KEYWORDS['geometric']:
+            selected_prompts = _GEOMETRIC_PROMPTS
+        elif tokens & _PROMPT_THEME_KEYWORDS['elemental']:
+            selected_prompts = _ELEMENTAL_PROMPTS
         else:
             # Combine all prompts for general use
-            selected_prompts = cosmic_prompts + mystical_prompts + geometric_prompts
-        
-        return random.choice(selected_prompts)
+            selected_prompts = _GENERAL_PROMPTS
+
+        # Only the chosen template pays the interpolation cost
+        template = self._rng.choice(selected_prompts)
+        return template.format_map({'intent': intent, 'style': style})
     
     def save_output(self, result):
         """Save result to output.json"""
         try:
             with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+                f.write(_json_dumps(result))
         except Exception as e:
             print(f"Error saving output: {e}")
     
-    def log_session(self, prompt, response, result, timestamp):
+    def log_session(self, prompt, response, result, timestamp, clean_timestamp):
         """Save full session to timestamped log file"""
-        # Clean timestamp for Windows filename compatibility
-        clean_timestamp = timestamp.replace(':', '').replace('T', '-')[:15]
+        # clean_timestamp is Windows-filename safe, computed once in dream()
         log_filename = f"seed_{clean_timestamp}.log"
         log_path = os.path.join(self.logs_dir, log_filename)
         
+        # Preformat the whole log body so the file sees a single write
+        body = (
+            f"=== DREAMNET SESSION LOG ===\n"
+            f"Timestamp: {timestamp}\n"
+            f"Model: {self.model_name}\n\n"
+            f"PROMPT SENT:\n{prompt}\n\n"
+            f"RAW RESPONSE:\n{response}\n\n"
+            f"PARSED RESULT:\n{_json_dumps(result)}\n"
+        )
+
         try:
-            with open(log_path, 'w', encoding='utf-8') as f:
-                f.write(f"=== DREAMNET SESSION LOG ===\n")
-                f.write(f"Timestamp: {timestamp}\n")
-                f.write(f"Model: {self.model_name}\n\n")
-                f.write(f"PROMPT SENT:\n{prompt}\n\n")
-                f.write(f"RAW RESPONSE:\n{response}\n\n")
-                f.write(f"PARSED RESULT:\n{json.dumps(result, indent=2, ensure_ascii=False)}\n")
+            with open(log_path, 'w', encoding='utf-8', buffering=65536) as f:
+                f.write(body)
         except Exception as e:
             print(f"Error saving log: {e}")
     
-    def append_to_echo(self, result, concept, timestamp):
+    def append_to_echo(self, result, concept, display_time):
         """Append result to echoes/{concept}.md"""
         echo_file = os.path.join(self.echoes_dir, f"{concept}.md")
-        
-        # Format timestamp for display
-        display_time = timestamp.replace('T', '-').replace(':', '')[:13]
-        
+
         entry = f"""## {display_time}
 **Symbol**: {result['symbol']}  
 **Phrase**: {result['phrase']}  
@@ -392,83 +758,37 @@ Let fire, water, earth, and air speak through you."""
 """
         
         try:
-            # Create file if it doesn't exist or append to existing
-            mode = 'a' if os.path.exists(echo_file) else 'w'
-            with open(echo_file, mode, encoding='utf-8') as f:
-                if mode == 'w':
-                    f.write(f"# {concept.title()} Echoes\n\n")
+            # 'a+' plus tell() decides the header in the same open that
+            # does the append: no separate stat and no exists/open race
+            with open(echo_file, 'a+', encoding='utf-8', buffering=65536) as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    entry = f"# {concept.title()} Echoes\n\n{entry}"
                 f.write(entry)
         except Exception as e:
             print(f"Error writing to echo file: {e}")
     
-    def get_enhanced_fallback(self, intent=""):
+    def get_enhanced_fallback(self, intent="", concept=None):
         """Generate enhanced fallback based on intent analysis with weighted selection"""
-        intent_lower = intent.lower()
-        
-        # Enhanced thematic mapping with weighted symbol selection
-        theme_weights = {}
-        
-        # Analyze intent and build weighted pools
-        if any(word in intent_lower for word in ['love', 'heart', 'compassion', 'kindness', 'forgiveness']):
-            theme_weights['mystical'] = 3
-            theme_weights['sacred'] = 2
-            theme_symbols = (self.symbol_pools['mystical'] * 3 + 
-                           self.symbol_pools['sacred'] * 2 + 
-                           ['💖', '♥', '❤', '💕', '💗', '💝'] * 4)
-            theme_colors = self.color_palettes['warm'] + self.color_palettes['spirit']
-        elif any(word in intent_lower for word in ['wisdom', 'knowledge', 'understanding', 'learning', 'truth']):
-            theme_weights['cosmic'] = 3
-            theme_weights['ancient'] = 3
-            theme_symbols = (self.symbol_pools['cosmic'] * 3 + 
-                           self.symbol_pools['ancient'] * 3 +
-                           self.symbol_pools['ethereal'] * 2)
-            theme_colors = self.color_palettes['cosmic'] + self.color_palettes['twilight']
-        elif any(word in intent_lower for word in ['peace', 'calm', 'balance', 'harmony', 'stillness']):
-            theme_weights['sacred'] = 3
-            theme_weights['flow'] = 2
-            theme_symbols = (self.symbol_pools['sacred'] * 3 + 
-                           self.symbol_pools['flow'] * 2 +
-                           ['☯', '◎', '○', '☮', '🕊'] * 4)
-            theme_colors = self.color_palettes['cool'] + self.color_palettes['ethereal']
-        elif any(word in intent_lower for word in ['growth', 'change', 'transformation', 'journey', 'evolution']):
-            theme_weights['transformation'] = 4
-            theme_weights['nature'] = 2
-            theme_symbols = (self.symbol_pools['transformation'] * 4 + 
-                           self.symbol_pools['nature'] * 2 +
-                           self.symbol_pools['elemental'])
-            theme_colors = self.color_palettes['nature'] + self.color_palettes['aurora']
-        elif any(word in intent_lower for word in ['power', 'strength', 'energy', 'force', 'intensity']):
-            theme_weights['energy'] = 4
-            theme_weights['elemental'] = 3
-            theme_symbols = (self.symbol_pools['energy'] * 4 + 
-                           self.symbol_pools['elemental'] * 3)
-            theme_colors = self.color_palettes['fire'] + self.color_palettes['warm']
-        elif any(word in intent_lower for word in ['mystery', 'unknown', 'hidden', 'secret', 'veil']):
-            theme_weights['mystical'] = 3
-            theme_weights['celestial'] = 2
-            theme_symbols = (self.symbol_pools['mystical'] * 3 + 
-                           self.symbol_pools['celestial'] * 2 +
-                           self.symbol_pools['cosmic'])
-            theme_colors = self.color_palettes['twilight'] + self.color_palettes['mystical']
-        elif any(word in intent_lower for word in ['quantum', 'science', 'mathematics', 'logic']):
-            theme_weights['quantum'] = 4
-            theme_weights['geometric'] = 2
-            theme_symbols = (self.symbol_pools['quantum'] * 4 + 
-                           self.symbol_pools['geometric'] * 2)
-            theme_colors = self.color_palettes['cosmic'] + self.color_palettes['cool']
-        else:
-            # Default balanced selection
-            theme_symbols = (self.symbol_pools['cosmic'] + 
-                           self.symbol_pools['geometric'] + 
-                           self.symbol_pools['mystical'])
-            theme_colors = self.color_palettes['cosmic'] + self.color_palettes['ethereal']
-        
+        tokens = frozenset(_WORD_RE.findall(intent.lower()))
+
+        # Reuse the concept dream() already extracted when available
+        if concept is None:
+            concept = self.extract_concept(intent)
+
+        # Detect fallback theme and draw from its precomputed weighted pool
+        theme = next((name for name, keywords in _FALLBACK_THEME_KEYWORDS.items()
+                      if tokens & keywords), 'default')
+
+        population, weights = _FALLBACK_SYMBOLS[theme]
+        theme_colors = _THEME_COLORS[theme]
+
         # Create enhanced fallback
-        selected_symbol = random.choice(theme_symbols)
-        selected_color = random.choice(theme_colors)
+        selected_symbol = self._rng.choices(population, weights)[0]
+        selected_color = self._rng.choice(theme_colors)
         
         # Enhanced contextual phrases based on intent
-        if 'love' in intent_lower or 'heart' in intent_lower:
+        if 'love' in tokens or 'heart' in tokens:
             phrases = [
                 "Love transcends all boundaries, weaving souls into one tapestry.",
                 "In the heart's chamber, all beings find their home.",
@@ -476,7 +796,7 @@ Let fire, water, earth, and air speak through you."""
                 "The heart knows truths the mind cannot fathom.",
                 "Love is the force that binds the universe in sacred unity."
             ]
-        elif 'wisdom' in intent_lower or 'knowledge' in intent_lower:
+        elif 'wisdom' in tokens or 'knowledge' in tokens:
             phrases = [
                 "Wisdom emerges from the silence between thoughts.",
                 "In the library of the cosmos, all truths are written.",
@@ -484,7 +804,7 @@ Let fire, water, earth, and air speak through you."""
                 "The wise see patterns where others see chaos.",
                 "Understanding dawns when the mind becomes still water."
             ]
-        elif 'peace' in intent_lower or 'balance' in intent_lower:
+        elif 'peace' in tokens or 'balance' in tokens:
             phrases = [
                 "In perfect stillness, the universe reveals its rhythm.",
                 "Balance is the dance between holding and releasing.",
@@ -492,7 +812,7 @@ Let fire, water, earth, and air speak through you."""
                 "Harmony emerges when all voices sing as one.",
                 "In the center of the storm lies perfect calm."
             ]
-        elif 'transformation' in intent_lower or 'change' in intent_lower:
+        elif 'transformation' in tokens or 'change' in tokens:
             phrases = [
                 "Every ending births a new beginning in the cosmic dance.",
                 "Transformation requires the courage to release the familiar.",
@@ -514,64 +834,64 @@ Let fire, water, earth, and air speak through you."""
                 "The cosmic web connects all things in sacred resonance."
             ]
         
-        selected_phrase = random.choice(phrases)
+        selected_phrase = self._rng.choice(phrases)
         
         return {
             "symbol": selected_symbol,
             "phrase": selected_phrase,
             "color": selected_color,
-            "reasoning": f"When direct communion fails, the {selected_symbol} emerges as a beacon through the symbolic realm, chosen for its resonance with the essence of {concept if (concept := self.extract_concept(intent)) != 'dream' else 'the eternal mystery'}."
+            "reasoning": f"When direct communion fails, the {selected_symbol} emerges as a beacon through the symbolic realm, chosen for its resonance with the essence of {concept if concept != 'dream' else 'the eternal mystery'}."
         }
 
-    def enhance_model_response(self, result, intent=""):
+    def enhance_model_response(self, result, intent="", concept=None):
         """Enhance model response with additional symbolic resonance"""
         if not result:
             return None
             
         # Add color if missing, using weighted thematic selection
         if not result.get('color'):
-            intent_lower = intent.lower()
-            
-            # Build weighted color selection based on multiple themes
+            tokens = frozenset(_WORD_RE.findall(intent.lower()))
+
+            # Build weighted color selection from the precomputed vectors
             color_weights = []
-            
-            if any(word in intent_lower for word in ['love', 'heart', 'warm', 'passion']):
-                color_weights.extend(self.color_palettes['warm'] * 3)
-                color_weights.extend(self.color_palettes['spirit'] * 2)
-            if any(word in intent_lower for word in ['peace', 'calm', 'cool', 'serene']):
-                color_weights.extend(self.color_palettes['cool'] * 3)
-                color_weights.extend(self.color_palettes['ethereal'] * 2)
-            if any(word in intent_lower for word in ['nature', 'growth', 'earth', 'organic']):
-                color_weights.extend(self.color_palettes['nature'] * 3)
-                color_weights.extend(self.color_palettes['earth'] * 2)
-            if any(word in intent_lower for word in ['cosmic', 'space', 'universe', 'stars']):
-                color_weights.extend(self.color_palettes['cosmic'] * 3)
-                color_weights.extend(self.color_palettes['twilight'] * 2)
-            if any(word in intent_lower for word in ['mystery', 'magic', 'mystical', 'spiritual']):
-                color_weights.extend(self.color_palettes['mystical'] * 3)
-                color_weights.extend(self.color_palettes['spirit'] * 2)
-            if any(word in intent_lower for word in ['ocean', 'water', 'flow', 'wave']):
-                color_weights.extend(self.color_palettes['ocean'] * 3)
-                color_weights.extend(self.color_palettes['cool'] * 2)
-            if any(word in intent_lower for word in ['fire', 'energy', 'power', 'strength']):
-                color_weights.extend(self.color_palettes['fire'] * 3)
-                color_weights.extend(self.color_palettes['warm'] * 2)
-            
+            for theme_name, keywords in _COLOR_THEME_KEYWORDS.items():
+                if tokens & keywords:
+                    color_weights.extend(_ENHANCE_COLOR_WEIGHTS[theme_name])
+
             # Default if no specific themes detected
             if not color_weights:
-                color_weights = (self.color_palettes['mystical'] + 
-                               self.color_palettes['cosmic'] + 
-                               self.color_palettes['ethereal'])
-            
-            result['color'] = random.choice(color_weights)
+                color_weights = _ENHANCE_DEFAULT_COLORS
+
+            result['color'] = self._rng.choice(color_weights)
         
-        # Enhance reasoning if too short
+        # Enhance reasoning if too short, reusing the concept the caller
+        # already extracted instead of re-scanning the intent
         if result.get('reasoning') and len(result['reasoning']) < 50:
-            concept = self.extract_concept(intent)
+            if concept is None:
+                concept = self.extract_concept(intent)
             result['reasoning'] = f"{result['reasoning']} This symbol resonates with the deep currents of {concept}, bridging the seen and unseen realms."
         
         return result
     
+    def dream_many(self, brain_data_list):
+        """Dream over a batch of brain configs on one warm connection
+
+        The persistent HTTP connection and the daemon-side keep_alive
+        amortize model warmup across the whole batch.
+        """
+        results = []
+        for brain_data in brain_data_list:
+            intent = brain_data.get('intent', '')
+            prompt = self.create_prompt(brain_data)
+            response = self.call_ollama(prompt)
+            result = self.parse_model_response(response) if response else None
+            if result:
+                result = self.enhance_model_response(result, intent)
+            else:
+                result = self.get_enhanced_fallback(intent)
+            results.append(result)
+        return results
+
     def dream(self):
         """Main dreaming process"""
         print("🌙 Dreamnet awakening...")
@@ -585,38 +905,71 @@ Let fire, water, earth, and air speak through you."""
         concept = self.extract_concept(brain_data.get('intent', ''))
         print(f"💭 Concept: {concept}")
         
-        # Create timestamp
-        timestamp = datetime.now().isoformat()
-        
-        # Generate prompt
-        prompt = self.create_prompt(brain_data)
-        
-        # Call model
-        print("🔮 Consulting the oracle...")
-        response = self.call_ollama(prompt)
-          # Parse response
-        result = self.parse_model_response(response) if response else None
-        
-        if result:
-            # Enhance the model response with additional symbolic resonance
-            result = self.enhance_model_response(result, brain_data.get('intent', ''))
-            print("✅ Oracle has spoken through the symbolic veil...")
+        # Create timestamps once: ISO form for the log body, pre-cleaned
+        # forms for filenames and echo headers
+        from datetime import datetime
+        now = datetime.now()
+        timestamp = now.isoformat()
+        clean_timestamp = now.strftime('%Y-%m-%d-%H%M')
+        display_time = now.strftime('%Y-%m-%d-%H')
+        
+        intent = brain_data.get('intent', '')
+        style = brain_data.get('style', '')
+
+        # Result cache first: a near-identical past dream skips the LLM
+        cached_result = self.lookup_cached_result(intent, style)
+        if cached_result:
+            print("♻️  Reusing cached dream result...")
+            prompt = ""
+            response = None
+            result = cached_result
         else:
-            print("⚠️  Model response invalid, using enhanced fallback...")
-            result = self.get_enhanced_fallback(brain_data.get('intent', ''))
+            # Generate prompt
+            prompt = self.create_prompt(brain_data)
+
+            # Call model (or reuse a cached response for an identical prompt)
+            response = self.load_cached_response(prompt)
+            if response:
+                print("♻️  Reusing cached oracle response...")
+            else:
+                print("🔮 Consulting the oracle...")
+                response = self.call_ollama(prompt)
+                if response:
+                    self.save_cached_response(prompt, response)
+            # Parse response
+            result = self.parse_model_response(response) if response else None
+
+            if result:
+                # Enhance the model response with additional symbolic resonance
+                result = self.enhance_model_response(result, intent, concept)
+                self.store_cached_result(intent, style, result)
+                print("✅ Oracle has spoken through the symbolic veil...")
+            else:
+                print("⚠️  Model response invalid, using enhanced fallback...")
+                result = self.get_enhanced_fallback(intent, concept)
         
         print(f"✨ Generated symbol: {result['symbol']}")
         print(f"📝 Phrase: {result['phrase']}")
         print(f"🎨 Color: {result.get('color', 'N/A')}")
         print(f"🔍 Reasoning: {result.get('reasoning', 'Mystery flows through silence')}")
         
-        # Save outputs
-        self.save_output(result)
-        self.log_session(prompt, response or "No response", result, timestamp)
-        self.append_to_echo(result, concept, timestamp)
-        
+        # Save outputs concurrently: the three writes are independent and
+        # the GIL is released during file I/O. The pool persists across
+        # dreams so repeated sessions don't pay thread startup each time.
+        if self._io_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._io_pool = ThreadPoolExecutor(max_workers=3)
+        futures = [
+            self._io_pool.submit(self.save_output, result),
+            self._io_pool.submit(self.log_session, prompt, response or "No response",
+                                 result, timestamp, clean_timestamp),
+            self._io_pool.submit(self.append_to_echo, result, concept, display_time)
+        ]
+        for future in futures:
+            future.result()
+
         print(f"💾 Results saved to {self.output_file}")
-        print(f"📋 Session logged to logs/seed_{timestamp.replace(':', '').replace('T', '-')[:15]}.log")
+        print(f"📋 Session logged to logs/seed_{clean_timestamp}.log")
         print(f"🌊 Echo added to echoes/{concept}.md")
         print("🌟 Dream complete.")
 
@@ -5,15 +5,74 @@ dreamnet - A dynamic symbolic generator
 Refactored to be configuration-driven, modular, and efficient.
 """
 
+import http.client
 import json
+import mmap
 import subprocess
 import sys
 import os
 from datetime import datetime
+from functools import cached_property
 import re
 import random
 from pathlib import Path
 
+# Optional: single-pass multi-pattern keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: fast JSON encoding for output/log writes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj):
+    """Pretty-print obj, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# Local Ollama daemon REST endpoint (kept alive across calls)
+_OLLAMA_HOST = "localhost"
+_OLLAMA_PORT = 11434
+
+# Precompiled patterns and word filters shared by the hot parsing paths
+_WORD_RE = re.compile(r'\b\w+\b')
+_LONG_WORD_RE = re.compile(r'\b\w{4,}\b')
+_STOP_WORDS = frozenset({'this', 'that', 'with', 'from', 'they', 'have',
+                         'will', 'been', 'explore', 'essence'})
+
+
+def _find_json_span(s):
+    """Locate the first balanced {...} region with one linear scan"""
+    depth = 0
+    start = -1
+    in_string = False
+    escape = False
+    for i, ch in enumerate(s):
+        if escape:
+            escape = False
+        elif in_string:
+            if ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    return None
+
 
 class DreamConfig:
     """Configuration manager for Dreamnet"""
@@ -21,8 +80,12 @@ class DreamConfig:
     def __init__(self, config_path=None):
         self.script_dir = Path(__file__).parent
         self.config_path = config_path or self.script_dir / "config.json"
-        self.config = self._load_config()
-    
+
+    @cached_property
+    def config(self):
+        """Parsed config dict, read from disk on first access"""
+        return self._load_config()
+
     def _load_config(self):
         """Load configuration from JSON file"""
         try:
@@ -33,15 +96,25 @@ class DreamConfig:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file: {e}")
     
+    @cached_property
+    def _flat(self):
+        """Config flattened to dotted keys for single-lookup gets
+
+        Dict nodes are indexed alongside their leaves so callers can
+        still fetch whole sections like 'themes'.
+        """
+        def _flatten(d, prefix=''):
+            for key, value in d.items():
+                flat_key = f"{prefix}.{key}" if prefix else key
+                yield flat_key, value
+                if isinstance(value, dict):
+                    yield from _flatten(value, flat_key)
+
+        return dict(_flatten(self.config))
+
     def get(self, *keys, default=None):
         """Get nested configuration value"""
-        current = self.config
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return default
-        return current
+        return self._flat.get(".".join(keys), default)
 
 
 class SymbolEngine:
@@ -49,55 +122,95 @@ class SymbolEngine:
     
     def __init__(self, config):
         self.config = config
-        self._symbol_cache = {}
-        self._color_cache = {}
+
+        # The config is immutable after load, so resolve every theme's
+        # symbol and color pools once here instead of lazily per lookup.
+        # Glyphs and colors recur across pools, so intern them: shared
+        # entries become one str object with pointer-fast equality.
+        self._fallback_symbols = tuple(
+            sys.intern(s) for s in config.get('symbols', 'fallback', default="∞"))
+        self._fallback_colors = (
+            sys.intern(config.get('colors', 'fallback', default="#7f8c8d")),)
+        self._theme_symbols = {}
+        self._theme_colors = {}
+        for theme_name, theme_data in config.get('themes', default={}).items():
+            symbols = []
+            for pool_name in theme_data.get('symbols', ['cosmic']):
+                symbols.extend(config.get('symbols', 'base_pools', pool_name, default=""))
+            colors = []
+            for palette_name in theme_data.get('colors', ['cosmic']):
+                colors.extend(config.get('colors', 'base_palettes', palette_name, default=[]))
+            self._theme_symbols[theme_name] = (
+                tuple(sys.intern(s) for s in symbols) or self._fallback_symbols)
+            self._theme_colors[theme_name] = (
+                tuple(sys.intern(c) for c in colors) or self._fallback_colors)
+
+        # One keyword automaton replaces themes × keywords substring
+        # scans when pyahocorasick is available
+        self._kw_automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for theme_name, theme_data in config.get('themes', default={}).items():
+                for keyword in theme_data.get('keywords', []):
+                    automaton.add_word(keyword, (theme_name, keyword))
+            automaton.make_automaton()
+            self._kw_automaton = automaton
+
+        # Specialize detect_theme for this config: emit straight-line
+        # 'keyword in s' tests once and bind the compiled function, so
+        # the hot path has no loop over themes at all
+        lines = ["def _detect(s):", "    s = s.lower()"]
+        scored = []
+        themes = config.get('themes', default={})
+        for index, (theme_name, theme_data) in enumerate(themes.items()):
+            var = f"s{index}"
+            scored.append(f"({var}, {-index}, {theme_name!r})")
+            lines.append(f"    {var} = 0")
+            for keyword in theme_data.get('keywords', []):
+                lines.append(f"    if {keyword!r} in s: {var} += 1")
+        if scored:
+            lines.append(f"    best = max({', '.join(scored)})")
+            lines.append("    return best[2] if best[0] else 'wisdom'")
+        else:
+            lines.append("    return 'wisdom'")
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        self.detect_theme = namespace['_detect']
+
+    def score_themes(self, intent_lower):
+        """Tally keyword hits per theme for lowercased intent text"""
+        theme_scores = {}
+        if self._kw_automaton is not None:
+            # Single linear scan; each keyword counts at most once per
+            # theme so repeated words score the same as the substring
+            # fallback's 0/1-per-keyword tally
+            seen = set()
+            for _, hit in self._kw_automaton.iter(intent_lower):
+                if hit not in seen:
+                    seen.add(hit)
+                    theme_name = hit[0]
+                    theme_scores[theme_name] = theme_scores.get(theme_name, 0) + 1
+            return theme_scores
+
+        for theme_name, theme_data in self.config.get('themes', default={}).items():
+            keywords = theme_data.get('keywords', [])
+            score = sum(1 for keyword in keywords if keyword in intent_lower)
+            if score > 0:
+                theme_scores[theme_name] = score
+        return theme_scores
     
     def get_symbols_for_theme(self, theme_name):
         """Get symbols for a specific theme"""
-        if theme_name in self._symbol_cache:
-            return self._symbol_cache[theme_name]
-        
-        theme = self.config.get('themes', theme_name, default={})
-        symbol_pools = theme.get('symbols', ['cosmic'])
-        
-        symbols = []
-        for pool_name in symbol_pools:
-            pool_chars = self.config.get('symbols', 'base_pools', pool_name, default="")
-            symbols.extend(list(pool_chars))
-        
-        # Cache and return
-        self._symbol_cache[theme_name] = symbols
-        return symbols
-    
+        return self._theme_symbols.get(theme_name, self._fallback_symbols)
+
     def get_colors_for_theme(self, theme_name):
         """Get colors for a specific theme"""
-        if theme_name in self._color_cache:
-            return self._color_cache[theme_name]
-        
-        theme = self.config.get('themes', theme_name, default={})
-        color_palettes = theme.get('colors', ['cosmic'])
-        
-        colors = []
-        for palette_name in color_palettes:
-            palette = self.config.get('colors', 'base_palettes', palette_name, default=[])
-            colors.extend(palette)
-        
-        # Cache and return
-        self._color_cache[theme_name] = colors
-        return colors
+        return self._theme_colors.get(theme_name, self._fallback_colors)
     
     def detect_theme(self, intent):
         """Detect theme from intent text"""
-        intent_lower = intent.lower()
-        
-        # Score themes based on keyword matches
-        theme_scores = {}
-        for theme_name, theme_data in self.config.get('themes', default={}).items():
-            keywords = theme_data.get('keywords', [])
-            score = sum(1 for keyword in keywords if keyword in intent_lower)
-            if score > 0:
-                theme_scores[theme_name] = score
-        
+        theme_scores = self.score_themes(intent.lower())
+
         # Return highest scoring theme or default
         if theme_scores:
             return max(theme_scores.items(), key=lambda x: x[1])[0]
@@ -109,35 +222,62 @@ class SymbolEngine:
         
         symbols = self.get_symbols_for_theme(theme)
         colors = self.get_colors_for_theme(theme)
-        
-        # Fallback to config defaults if empty
-        if not symbols:
-            symbols = list(self.config.get('symbols', 'fallback', default="∞"))
-        if not colors:
-            colors = [self.config.get('colors', 'fallback', default="#7f8c8d")]
-        
+
         return random.choice(symbols), random.choice(colors), theme
 
+    def select_many(self, intents):
+        """Select (symbol, color, theme) for a batch of intents
+
+        Grouping by theme lets one random.choices call cover every
+        intent in the group instead of two RNG calls per dream.
+        """
+        themes = [self.detect_theme(intent) for intent in intents]
+        counts = {}
+        for theme in themes:
+            counts[theme] = counts.get(theme, 0) + 1
+
+        picks = {}
+        for theme, count in counts.items():
+            symbols = random.choices(self.get_symbols_for_theme(theme), k=count)
+            colors = random.choices(self.get_colors_for_theme(theme), k=count)
+            picks[theme] = list(zip(symbols, colors))
+
+        selections = []
+        for theme in themes:
+            symbol, color = picks[theme].pop()
+            selections.append((symbol, color, theme))
+        return selections
+
 
 class PromptGenerator:
     """Dynamic prompt generation"""
     
+    # Split points for the two supported placeholders
+    _FIELD_RE = re.compile(r'\{(intent|style)\}')
+
     def __init__(self, config):
         self.config = config
-    
+
+        base_template = config.get('prompts', 'base_template', default="")
+        variations = config.get('prompts', 'variations', default=[])
+        templates = ([f"{variation}\n\n{base_template}" for variation in variations]
+                     or [base_template])
+
+        # Parse each template once: odd slots are field names, even slots
+        # literal text with format-style {{ }} escapes already resolved
+        self._compiled = []
+        for template in templates:
+            parts = self._FIELD_RE.split(template)
+            parts[::2] = [chunk.replace('{{', '{').replace('}}', '}')
+                          for chunk in parts[::2]]
+            self._compiled.append(parts)
+
     def create_prompt(self, intent, style):
-        """Create dynamic prompt from template"""
-        base_template = self.config.get('prompts', 'base_template', default="")
-        variations = self.config.get('prompts', 'variations', default=[])
-        
-        # Add variation if available
-        if variations:
-            variation = random.choice(variations)
-            prompt = f"{variation}\n\n{base_template}"
-        else:
-            prompt = base_template
-        
-        return prompt.format(intent=intent, style=style)
+        """Create dynamic prompt from a precompiled template"""
+        parts = random.choice(self._compiled)
+        values = {'intent': intent, 'style': style}
+        return "".join(values[part] if i & 1 else part
+                       for i, part in enumerate(parts))
 
 
 class DreamAgent:
@@ -150,48 +290,161 @@ class DreamAgent:
         
         # Setup paths
         self.script_dir = Path(__file__).parent
-        self.brain_file = self.script_dir / "brain.json"
-        self.output_file = self.script_dir / "output.json"
+        # DREAMNET_BRAIN lets a launcher point at any brain config
+        # without copying it over brain.json first
+        self.brain_file = Path(
+            os.environ.get("DREAMNET_BRAIN", self.script_dir / "brain.json"))
+        self.output_file = Path(
+            os.environ.get("DREAMNET_OUTPUT", self.script_dir / "output.json"))
         self.logs_dir = self.script_dir / "logs"
         self.echoes_dir = self.script_dir / "echoes"
         
         # Create directories
         self.logs_dir.mkdir(exist_ok=True)
         self.echoes_dir.mkdir(exist_ok=True)
+
+        # Persistent HTTP connection to the Ollama daemon (created lazily)
+        self._ollama_conn = None
+
+        # Echo paths by concept, so batch runs don't rebuild Path objects
+        self._echo_paths = {}
     
     def load_brain(self):
         """Load intent and style from brain.json"""
         try:
-            with open(self.brain_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # mmap the file so the parser reads the page cache directly
+            # instead of decoding through a text-mode buffer first
+            with open(self.brain_file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if orjson is not None:
+                        return orjson.loads(memoryview(mm))
+                    return json.loads(bytes(mm))
         except FileNotFoundError:
             print(f"Error: {self.brain_file} not found")
             sys.exit(1)
-        except json.JSONDecodeError:
+        except ValueError:
             print(f"Error: Invalid JSON in {self.brain_file}")
             sys.exit(1)
     
     def extract_concept(self, intent):
         """Extract main concept for echo file naming"""
-        # Simple approach: look for theme keywords
-        for theme_name, theme_data in self.config.get('themes', default={}).items():
-            keywords = theme_data.get('keywords', [])
-            if any(keyword in intent.lower() for keyword in keywords):
-                return theme_name
-        
-        # Fallback: extract longest meaningful word
-        words = re.findall(r'\b\w{4,}\b', intent.lower())
-        stop_words = {'this', 'that', 'with', 'from', 'they', 'have', 'will', 'been', 'explore', 'essence'}
-        meaningful_words = [w for w in words if w not in stop_words]
-        
-        return meaningful_words[0] if meaningful_words else "dream"
+        # Simple approach: look for theme keywords (shared automaton scan)
+        theme_scores = self.symbol_engine.score_themes(intent.lower())
+        if theme_scores:
+            return max(theme_scores.items(), key=lambda x: x[1])[0]
+
+        # Fallback: return the first meaningful word, no list built
+        for word in _LONG_WORD_RE.findall(intent.lower()):
+            if word not in _STOP_WORDS:
+                return word
+        return "dream"
     
+    def _call_ollama_http(self, prompt):
+        """Query the Ollama daemon over a persistent HTTP connection"""
+        timeout = self.config.get('model', 'timeout', default=60)
+        if self._ollama_conn is None:
+            self._ollama_conn = http.client.HTTPConnection(
+                _OLLAMA_HOST, _OLLAMA_PORT, timeout=timeout)
+
+        body = json.dumps({
+            "model": self.config.get('model', 'name', default='qwen3:1.7b'),
+            "prompt": prompt,
+            "stream": False,
+            # Keep the model resident in VRAM between invocations
+            "keep_alive": self.config.get('model', 'keep_alive', default='30m')
+        })
+        try:
+            self._ollama_conn.request(
+                "POST", "/api/generate", body,
+                {"Content-Type": "application/json"})
+            http_response = self._ollama_conn.getresponse()
+            payload = http_response.read()
+            if http_response.status != 200:
+                return None
+            return json.loads(payload).get("response", "").strip()
+        except Exception:
+            # Drop the dead connection so the next call can rebuild it
+            self._ollama_conn.close()
+            self._ollama_conn = None
+            raise
+
+    def _call_ollama_isolated(self, prompt):
+        """One-shot HTTP call on a private connection (thread-safe)"""
+        timeout = self.config.get('model', 'timeout', default=60)
+        conn = http.client.HTTPConnection(_OLLAMA_HOST, _OLLAMA_PORT, timeout=timeout)
+        try:
+            body = json.dumps({
+                "model": self.config.get('model', 'name', default='qwen3:1.7b'),
+                "prompt": prompt,
+                "stream": False,
+                "keep_alive": self.config.get('model', 'keep_alive', default='30m')
+            })
+            conn.request("POST", "/api/generate", body,
+                         {"Content-Type": "application/json"})
+            http_response = conn.getresponse()
+            payload = http_response.read()
+            if http_response.status != 200:
+                return None
+            return json.loads(payload).get("response", "").strip()
+        except (OSError, http.client.HTTPException, json.JSONDecodeError):
+            # One dropped response must not abort the whole dream_many
+            # batch; this brain just falls back like the others
+            return None
+        finally:
+            conn.close()
+
+    def dream_many(self, brains):
+        """Generate one result per brain dict, dispatching model calls
+        concurrently against the Ollama daemon
+
+        Prompts are built up front; the in-flight requests overlap so a
+        batch costs roughly one model round-trip instead of N.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        prompts = [
+            self.prompt_generator.create_prompt(
+                brain.get('intent', ''), brain.get('style', ''))
+            for brain in brains
+        ]
+
+        if prompts:
+            with ThreadPoolExecutor(max_workers=min(4, len(prompts))) as executor:
+                responses = list(executor.map(self._call_ollama_isolated, prompts))
+        else:
+            responses = []
+
+        # Batch the RNG work: one selection pass covers every brain
+        selections = self.symbol_engine.select_many(
+            [brain.get('intent', '') for brain in brains])
+
+        results = []
+        for brain, response, (_, color, _) in zip(brains, responses, selections):
+            result = self.parse_response(response) if response else None
+            if result:
+                if not result.get('color'):
+                    result['color'] = color
+            else:
+                result = self.get_fallback(brain.get('intent', ''))
+            results.append(result)
+        return results
+
     def call_ollama(self, prompt):
         """Call Ollama model"""
+        try:
+            # Prefer the daemon's REST API: no fork/exec per call and the
+            # TCP connection is reused across dreams
+            return self._call_ollama_http(prompt)
+        except (OSError, http.client.HTTPException, json.JSONDecodeError):
+            # HTTPException covers mid-response failures (IncompleteRead,
+            # BadStatusLine) when the daemon dies between request and body
+            pass
+
+        # Fall back to the CLI when the daemon isn't reachable
         try:
             model_name = self.config.get('model', 'name', default='qwen3:1.7b')
             timeout = self.config.get('model', 'timeout', default=60)
-            
+
             cmd = ["ollama", "run", model_name, prompt]
             result = subprocess.run(
                 cmd, 
@@ -219,14 +472,14 @@ class DreamAgent:
         if not response:
             return None
             
+        # Find the first balanced JSON object without regex backtracking
+        span = _find_json_span(response)
+        if span is None:
+            return None
         try:
-            # Find JSON in response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+            return json.loads(response[span[0]:span[1]])
         except json.JSONDecodeError:
-            pass
-        return None
+            return None
     
     def get_fallback(self, intent):
         """Get enhanced fallback response"""
@@ -254,30 +507,34 @@ class DreamAgent:
         """Save result to output.json"""
         try:
             with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+                f.write(_json_dumps(result))
         except Exception as e:
             print(f"Error saving output: {e}")
     
-    def log_session(self, prompt, response, result, timestamp):
+    def log_session(self, prompt, response, result, timestamp, clean_timestamp):
         """Save session log"""
-        clean_timestamp = timestamp.replace(':', '').replace('T', '-')[:15]
         log_file = self.logs_dir / f"seed_{clean_timestamp}.log"
         
+        # Assemble the whole log in memory: one write() instead of six
+        payload = (
+            f"=== DREAMNET SESSION LOG ===\n"
+            f"Timestamp: {timestamp}\n"
+            f"Model: {self.config.get('model', 'name', default='qwen3:1.7b')}\n\n"
+            f"PROMPT:\n{prompt}\n\n"
+            f"RESPONSE:\n{response or 'No response'}\n\n"
+            f"RESULT:\n{_json_dumps(result)}\n"
+        )
         try:
             with open(log_file, 'w', encoding='utf-8') as f:
-                f.write(f"=== DREAMNET SESSION LOG ===\n")
-                f.write(f"Timestamp: {timestamp}\n")
-                f.write(f"Model: {self.config.get('model', 'name', default='qwen3:1.7b')}\n\n")
-                f.write(f"PROMPT:\n{prompt}\n\n")
-                f.write(f"RESPONSE:\n{response or 'No response'}\n\n")
-                f.write(f"RESULT:\n{json.dumps(result, indent=2, ensure_ascii=False)}\n")
+                f.write(payload)
         except Exception as e:
             print(f"Error saving log: {e}")
     
-    def append_echo(self, result, concept, timestamp):
+    def append_echo(self, result, concept, display_time):
         """Append to echo file"""
-        echo_file = self.echoes_dir / f"{concept}.md"
-        display_time = timestamp.replace('T', '-').replace(':', '')[:13]
+        echo_file = self._echo_paths.get(concept)
+        if echo_file is None:
+            echo_file = self._echo_paths[concept] = self.echoes_dir / f"{concept}.md"
         
         entry = f"""## {display_time}
 **Symbol**: {result['symbol']}  
@@ -287,10 +544,11 @@ class DreamAgent:
 """
         
         try:
-            mode = 'a' if echo_file.exists() else 'w'
-            with open(echo_file, mode, encoding='utf-8') as f:
-                if mode == 'w':
-                    f.write(f"# {concept.title()} Echoes\n\n")
+            # 'a+' plus tell() replaces the exists() stat and its race
+            with open(echo_file, 'a+', encoding='utf-8') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    entry = f"# {concept.title()} Echoes\n\n{entry}"
                 f.write(entry)
         except Exception as e:
             print(f"Error writing echo: {e}")
@@ -334,11 +592,13 @@ class DreamAgent:
         print(f"📝 Phrase: {result['phrase']}")
         print(f"🎨 Color: {result.get('color', 'N/A')}")
         
-        # Save everything
-        timestamp = datetime.now().isoformat()
+        # Save everything (strftime emits each form directly, no
+        # replace()-chain temporaries)
+        now = datetime.now()
         self.save_output(result)
-        self.log_session(prompt, response, result, timestamp)
-        self.append_echo(result, concept, timestamp)
+        self.log_session(prompt, response, result, now.isoformat(),
+                         now.strftime('%Y-%m-%d-%H%M'))
+        self.append_echo(result, concept, now.strftime('%Y-%m-%d-%H'))
         
         print(f"💾 Results saved")
         print("🌟 Dream complete.")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+dream_worker.py - Long-lived dream runner for batch generation
+
+Spawned once per batch worker with an engine script and the shared
+config; imports the engine a single time, then runs one dream per
+stdin line (a brain config path), replying OK/ERR on stdout. This
+amortizes interpreter startup and module imports across a whole batch
+instead of paying them for every dream.
+"""
+
+import atexit
+import contextlib
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+
+
+def _symlink_or_copy(src, dst):
+    """Symlink src into the workdir, copying bytes only if we must"""
+    try:
+        os.symlink(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def main():
+    engine_script = os.path.abspath(sys.argv[1])
+    shared_config = sys.argv[2] if len(sys.argv) > 2 else ""
+
+    # Isolated workdir: the engine resolves output/log/echo paths from
+    # its own location, so give it a private copy to write next to
+    workdir = tempfile.mkdtemp(prefix="dreamnet_worker_")
+    atexit.register(shutil.rmtree, workdir, ignore_errors=True)
+    script_copy = os.path.join(workdir, os.path.basename(engine_script))
+    _symlink_or_copy(engine_script, script_copy)
+    if shared_config and os.path.exists(shared_config):
+        _symlink_or_copy(shared_config, os.path.join(workdir, "config.json"))
+
+    spec = importlib.util.spec_from_file_location("dream_engine", script_copy)
+    engine = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(engine)
+
+    output_file = os.path.join(workdir, "output.json")
+    for line in sys.stdin:
+        brain_path = line.strip()
+        if not brain_path:
+            break
+        os.environ["DREAMNET_BRAIN"] = brain_path
+        try:
+            # Engine chatter goes to stderr; stdout carries the protocol
+            with contextlib.redirect_stdout(sys.stderr):
+                engine.main()
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                print(f"ERR\texit {e.code}", flush=True)
+                continue
+        except Exception as e:
+            print(f"ERR\t{e}", flush=True)
+            continue
+        print(f"OK\t{output_file}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,808 @@
+#!/usr/bin/env python3
+"""
+main_gate.py - Interactive launcher for the dreamnet engines
+
+Menu-driven front gate: generate dreams, run whole batches of brain
+configs, explore themes and manage configurations without editing
+files by hand.
+"""
+
+import os
+import signal
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Heavier stdlib modules (json, shutil, subprocess, tempfile) are
+# imported where used so a cold launch reaches the first menu faster.
+
+# Optional: fast JSON parse/encode for config files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+from performance_cache import PerformanceCache
+
+
+def _json_dumps(obj):
+    """Pretty-print obj to UTF-8 bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# One long-lived dream_worker.py per batch process, keyed by engine
+# script: the interpreter startup and engine imports are paid once per
+# worker, not once per dream. Each batch process has its own copy of
+# this dict, so workers are never shared across processes.
+_WORKERS = {}
+
+
+def _get_worker(engine_script, shared_config):
+    """Start (or reuse) the long-lived dream worker for an engine"""
+    worker = _WORKERS.get(engine_script)
+    if worker is None or worker.poll() is not None:
+        import subprocess
+        worker_script = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "dream_worker.py")
+        worker = subprocess.Popen(
+            [sys.executable, worker_script, engine_script, shared_config],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, encoding='utf-8',
+            bufsize=1)
+        _WORKERS[engine_script] = worker
+    return worker
+
+
+def _run_dream_for_config(config_name, config_path, engine_script, shared_config):
+    """Run one dream through the process's long-lived worker
+
+    The brain config travels as a path over the worker's stdin; the
+    reply names the worker-side output.json, which is read back here
+    before the next command reuses it.
+    """
+    try:
+        worker = _get_worker(engine_script, shared_config)
+        worker.stdin.write(config_path + "\n")
+        worker.stdin.flush()
+        reply = worker.stdout.readline().strip()
+    except (OSError, ValueError):
+        reply = ""
+
+    if reply.startswith("OK\t"):
+        output = None
+        try:
+            with open(reply.partition("\t")[2], 'rb') as f:
+                output = f.read()
+        except OSError:
+            pass
+        return config_name, 0, output
+    return config_name, 1, None
+
+
+class MainGate:
+    """Interactive control panel for the dreamnet engines"""
+
+    # Fixed menus get fixed option sets: O(1) membership, no per-prompt
+    # list building
+    _MAIN_OPTIONS = frozenset({"1", "2", "3", "4", "5", "6", "7", "8"})
+    _BRAIN_MGR_OPTIONS = frozenset({"1", "2", "3", "4", "5"})
+    _SYSTEM_OPTIONS = frozenset({"1", "2", "3", "4", "5"})
+    _CACHE_OPTIONS = frozenset({"1", "2", "3"})
+    _ENGINE_OPTIONS = frozenset({"1", "2"})
+
+    # Constant frames pre-encoded once at class load: redraws skip both
+    # string assembly and the utf-8 encode
+    _MENU_BYTES = (
+        "\n🎛️  MAIN MENU:\n"
+        "1. 🔮 Generate a dream\n"
+        "2. 📚 Batch dream generation\n"
+        "3. 🎨 Theme explorer\n"
+        "4. 🧠 Brain configuration manager\n"
+        "5. ⚙️  System configuration\n"
+        "6. 📊 Session stats\n"
+        "7. ❓ Help\n"
+        "8. 🚪 Exit\n"
+    ).encode('utf-8')
+
+    _BRAIN_MGR_MENU_BYTES = (
+        "\n🧠 BRAIN CONFIGURATION MANAGER\n"
+        "1. ✨ Create config\n"
+        "2. ✏️  Edit config\n"
+        "3. 🎯 Set active config\n"
+        "4. 🗑️  Delete config\n"
+        "5. 🔙 Back\n"
+    ).encode('utf-8')
+
+    _SYSTEM_MENU_BYTES = (
+        "\n⚙️  SYSTEM CONFIGURATION\n"
+        "1. 📄 View configuration\n"
+        "2. 🔍 Check dependencies\n"
+        "3. 🧹 Clear session data\n"
+        "4. 🗃️  Cache management\n"
+        "5. 🔙 Back\n"
+    ).encode('utf-8')
+
+    _CACHE_MENU_BYTES = (
+        "1. 🔄 Rebuild cache\n"
+        "2. 🧹 Clear cache\n"
+        "3. 🔙 Back\n"
+    ).encode('utf-8')
+
+    _HELP_BYTES = (
+        "\n❓ HELP\n"
+        "1. Generate a dream   - run one dream with the active brain.json\n"
+        "2. Batch generation   - run many brain_*.json configs in parallel\n"
+        "3. Theme explorer     - inspect themes, keywords and palettes\n"
+        "4. Brain manager      - create/edit/activate/delete brain configs\n"
+        "5. System config      - view config.json, check dependencies\n"
+        "6. Session stats      - counters for this session\n"
+        "7. Help               - this screen\n"
+        "8. Exit               - leave the gate\n"
+        "\nBrain configs are JSON files with 'intent' and 'style' keys.\n"
+    ).encode('utf-8')
+
+    def __init__(self):
+        self.script_dir = Path(__file__).parent
+        self.session_stats = {
+            'dreams_generated': 0,
+            'session_start': datetime.now()
+        }
+        # Uptime comes from a monotonic clock (no datetime math per
+        # header). Explored themes live in a bitmask over small interned
+        # ids — marking one is an OR, counting is bit_count()
+        self._session_start_monotonic = time.monotonic()
+        self._theme_index = {}
+        self._themes_bits = 0
+        # Uptime string re-rendered at most once per second; rapid
+        # menu redraws reuse the cached text
+        self._uptime_text = "0s"
+        self._uptime_rendered = self._session_start_monotonic
+        # Directory listings keyed by (dir, pattern) and guarded by the
+        # directory mtime, so menu redraws don't re-walk the filesystem
+        self._dir_cache = {}
+
+        # Shared parse cache for config.json and the brain configs
+        self.performance_cache = PerformanceCache()
+
+        # Brain configs are re-discovered lazily, only when the script
+        # directory's mtime says something changed
+        self.brain_configs = {}
+        self._brain_names = ()
+        self._brain_cache_mtime = None
+        self._get_brain_configs()
+        self.running = True
+
+        # One handler covers every prompt; no per-input() try frames
+        signal.signal(signal.SIGINT, self._on_sigint)
+
+        # O(1) dispatch tables instead of if/elif chains per keystroke
+        self._main_actions = {
+            "1": self.generate_dream,
+            "2": self.batch_dream_generation,
+            "3": self.theme_explorer,
+            "4": self.brain_configuration_manager,
+            "5": self.system_configuration,
+            "6": self.display_session_stats,
+            "7": self.display_help,
+            "8": self.handle_exit,
+        }
+        self._brain_mgr_actions = {
+            "1": self._create_brain_config,
+            "2": self._edit_brain_config,
+            "3": self._set_active_config,
+            "4": self._delete_brain_config,
+        }
+        self._system_actions = {
+            "1": self._view_configuration,
+            "2": self._check_dependencies,
+            "3": self._clear_session_data,
+            "4": self._cache_management,
+        }
+
+        # Numeric option sets keyed by (count, allow_blank), built once
+        self._numeric_opts = {}
+
+        # Last ollama probe as (monotonic time, status line); repeat
+        # dependency checks within the TTL skip the fork/exec
+        self._ollama_status = None
+
+        # Imported dream engines, keyed by module name: the interpreter
+        # and module imports are paid once, not per dream
+        self._engine_cache = {}
+
+
+    def _cached_glob(self, directory, pattern):
+        """Glob that only re-reads a directory when its mtime changes"""
+        key = (str(directory), pattern)
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return []
+        cached = self._dir_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        # One scandir with plain prefix/suffix checks: no per-entry
+        # fnmatch and no Path objects for names that don't match
+        prefix, _, suffix = pattern.partition('*')
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(
+                    Path(entry.path) for entry in it
+                    if entry.name.startswith(prefix)
+                    and entry.name.endswith(suffix))
+        except OSError:
+            return []
+        self._dir_cache[key] = (mtime, entries)
+        return entries
+
+    def _count_ext(self, dir_path, ext):
+        """Count directory entries with a suffix, without Path objects"""
+        try:
+            with os.scandir(dir_path) as it:
+                return sum(1 for e in it if e.name.endswith(ext))
+        except OSError:
+            return 0
+
+    def _read_json(self, path):
+        """Parse a JSON file through the shared performance cache"""
+        return self.performance_cache.get_config(path)
+
+    def _write_json(self, path, obj):
+        """Write a JSON file and drop its stale cache entry
+
+        One write_bytes call — no TextIOWrapper or incremental encoder
+        for files this small.
+        """
+        Path(path).write_bytes(_json_dumps(obj))
+        self.performance_cache.invalidate_cache(path)
+
+    def _discover_brain_configs(self):
+        """Find brain*.json configs next to the engines"""
+        configs = {}
+        for path in self._cached_glob(self.script_dir, "brain*.json"):
+            if path.name == "brain_backup.json":
+                continue
+            configs[path.stem] = path
+        return configs
+
+    def _get_brain_configs(self):
+        """Brain configs, re-discovered only when the directory changed"""
+        try:
+            mtime = os.stat(self.script_dir).st_mtime_ns
+        except OSError:
+            return self.brain_configs
+        if mtime != self._brain_cache_mtime:
+            self.brain_configs = self._discover_brain_configs()
+            # Menus index configs by number over and over; one tuple
+            # beats re-listing the dict keys on every prompt
+            self._brain_names = tuple(self.brain_configs)
+            self._brain_cache_mtime = mtime
+        return self.brain_configs
+
+    def clear_screen(self):
+        """Clear the terminal with an ANSI escape (no fork/exec)"""
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+
+    def display_header(self):
+        """Show the session banner with a single write"""
+        now = time.monotonic()
+        if now - self._uptime_rendered >= 1.0:
+            self._uptime_text = f"{int(now - self._session_start_monotonic)}s"
+            self._uptime_rendered = now
+        bar = "=" * 60
+        sys.stdout.write(
+            f"🌙 DREAMNET MAIN GATE\n{bar}\n"
+            f"⏱️  Session uptime: {self._uptime_text}\n"
+            f"🔮 Dreams generated: {self.session_stats['dreams_generated']}\n"
+            f"🎨 Themes explored: {self._themes_bits.bit_count()}\n"
+            f"{bar}\n")
+        sys.stdout.flush()
+
+    def display_main_menu(self):
+        """Show the main menu options"""
+        sys.stdout.buffer.write(self._MENU_BYTES)
+        sys.stdout.flush()
+
+    def _on_sigint(self, signum, frame):
+        """Exit cleanly on CTRL-C without a traceback"""
+        self.running = False
+        print("\n👋 Leaving the gate...")
+        sys.exit(0)
+
+    def get_user_input(self, prompt, valid_options=None):
+        """Prompt until the user enters a valid option"""
+        while True:
+            try:
+                user_input = input(prompt).strip()
+            except EOFError:
+                sys.exit(0)
+            if valid_options is None or user_input in valid_options:
+                return user_input
+            print(f"⚠️  Please choose one of: {', '.join(sorted(valid_options))}")
+
+    def _numeric_options(self, count, allow_blank=False):
+        """Frozenset of '1'..'count' (cached), optionally allowing ''"""
+        key = (count, allow_blank)
+        options = self._numeric_opts.get(key)
+        if options is None:
+            values = [str(i) for i in range(1, count + 1)]
+            if allow_blank:
+                values.append("")
+            options = self._numeric_opts[key] = frozenset(values)
+        return options
+
+    def _choose_engine(self):
+        """Ask which dream engine to use; returns the script name"""
+        choice = self.get_user_input(
+            "Engine [1=original, 2=v2]: ", self._ENGINE_OPTIONS)
+        return "dream.py" if choice == "1" else "dream_v2.py"
+
+    def _load_engine(self, script):
+        """Import a dream engine once and keep it warm"""
+        module_name = script[:-3]
+        module = self._engine_cache.get(module_name)
+        if module is None:
+            import importlib
+            if str(self.script_dir) not in sys.path:
+                sys.path.insert(0, str(self.script_dir))
+            module = importlib.import_module(module_name)
+            self._engine_cache[module_name] = module
+        return module
+
+    def generate_dream(self):
+        """Run a single dream through the chosen engine"""
+        print("\n🔮 GENERATE DREAM")
+        script = self._choose_engine()
+
+        print("🌙 Dreaming...")
+        try:
+            # In-process call: no interpreter startup or re-import per
+            # dream; fall back to a subprocess if the engine has no
+            # callable entry point
+            engine = self._load_engine(script)
+            entry = getattr(engine, 'main', None)
+            if entry is not None:
+                entry()
+            else:
+                # Stream the child's output line by line so progress
+                # shows live and the deadline can fire mid-dream
+                # instead of only after a blocking run() returns
+                import selectors
+                import subprocess
+                deadline = time.monotonic() + 120
+                proc = subprocess.Popen(
+                    [sys.executable, str(self.script_dir / script)],
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                    stdin=subprocess.DEVNULL, text=True,
+                    encoding='utf-8', errors='replace')
+                # Poll the pipe instead of blocking in readline(), so a
+                # child that hangs without printing still hits the
+                # deadline instead of wedging this loop forever
+                selector = selectors.DefaultSelector()
+                selector.register(proc.stdout, selectors.EVENT_READ)
+                timed_out = False
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        timed_out = True
+                        break
+                    if not selector.select(timeout=min(remaining, 1.0)):
+                        if proc.poll() is not None:
+                            break
+                        continue
+                    line = proc.stdout.readline()
+                    if not line:
+                        # EOF: the child closed stdout; wait out the
+                        # rest of the deadline for it to exit
+                        try:
+                            proc.wait(timeout=max(remaining, 0.1))
+                        except subprocess.TimeoutExpired:
+                            timed_out = True
+                        break
+                    sys.stdout.write(line)
+                selector.close()
+                if timed_out:
+                    proc.terminate()
+                    print("\n⏱️  Dream engine timed out")
+                proc.stdout.close()
+                if proc.wait() != 0:
+                    print("⚠️  Dream engine exited with an error")
+                    return
+            self.session_stats['dreams_generated'] += 1
+        except SystemExit:
+            print("⚠️  Dream engine exited with an error")
+        except Exception as e:
+            print(f"❌ Error running dream engine: {e}")
+
+    def batch_dream_generation(self):
+        """Run brain configs through an engine, one worker per config"""
+        print("\n📚 BATCH DREAM GENERATION")
+        if not self._get_brain_configs():
+            print("⚠️  No brain configs found (brain*.json)")
+            return
+
+        names = self._brain_names
+        sys.stdout.write(self._render_config_list()
+                         + f"\n{len(names) + 1}. All configs\n")
+
+        choice = self.get_user_input(
+            "Config to run: ", self._numeric_options(len(names) + 1))
+        if choice == str(len(names) + 1):
+            selected = names
+        else:
+            selected = (names[int(choice) - 1],)
+
+        engine_script = str(self.script_dir / self._choose_engine())
+        shared_config = str(self.script_dir / "config.json")
+
+        # Fan the configs out across processes; each worker dreams in
+        # its own temp directory so there is no shared-brain.json dance
+        # and no sleep between runs.
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        print(f"🌙 Dreaming {len(selected)} config(s)...")
+        started = time.time()
+        max_workers = min(len(selected), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_run_dream_for_config, name,
+                                str(self.brain_configs[name]),
+                                engine_script, shared_config)
+                for name in selected
+            ]
+            for future in as_completed(futures):
+                name, returncode, output = future.result()
+                if returncode == 0:
+                    self.session_stats['dreams_generated'] += 1
+                    if output:
+                        out_path = self.script_dir / f"output_{name}.json"
+                        out_path.write_bytes(output)
+                    print(f"✅ {name} complete")
+                else:
+                    print(f"❌ {name} failed")
+        print(f"🌟 Batch finished in {time.time() - started:.1f}s")
+
+    def theme_explorer(self):
+        """Browse the themes defined in config.json"""
+        print("\n🎨 THEME EXPLORER")
+        try:
+            config = self._read_json(self.script_dir / "config.json")
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read config.json: {e}")
+            return
+
+        themes = config.get('themes', {})
+        if not themes:
+            print("⚠️  No themes configured")
+            return
+
+        # Intern any theme names we haven't seen; ids are stable for
+        # the session even if config.json gains themes mid-run
+        index = self._theme_index
+        for name in themes:
+            if name not in index:
+                index[name] = len(index)
+
+        names = list(themes)
+        for i, name in enumerate(names, 1):
+            print(f"{i}. {name}")
+
+        choice = self.get_user_input(
+            "Theme to inspect (Enter to go back): ",
+            self._numeric_options(len(names), allow_blank=True))
+        if not choice:
+            return
+
+        name = names[int(choice) - 1]
+        theme = themes[name]
+        print(f"\n🌟 Theme: {name}")
+        print(f"🔑 Keywords: {', '.join(theme.get('keywords', []))}")
+        print(f"✨ Symbol pools: {', '.join(theme.get('symbols', []))}")
+        print(f"🎨 Color palettes: {', '.join(theme.get('colors', []))}")
+        self._themes_bits |= 1 << index[name]
+
+    def _render_config_list(self):
+        """Build the numbered brain-config listing as one string"""
+        return "\n".join(
+            f"{i}. {name} ({path.name})"
+            for i, (name, path) in enumerate(self.brain_configs.items(), 1))
+
+    def _pick_config(self, prompt):
+        """Let the user pick a brain config; returns its name or None"""
+        if not self._get_brain_configs():
+            print("⚠️  No brain configs found")
+            return None
+        names = self._brain_names
+        sys.stdout.write(self._render_config_list() + "\n")
+        choice = self.get_user_input(
+            prompt, self._numeric_options(len(names), allow_blank=True))
+        if not choice:
+            return None
+        return names[int(choice) - 1]
+
+    def _create_brain_config(self):
+        """Create a new brain_<name>.json"""
+        print("\n🧠 NEW BRAIN CONFIG")
+        name = self.get_user_input("Config name (letters/numbers): ")
+        if not name.isidentifier():
+            print("⚠️  Invalid name")
+            return
+        intent = self.get_user_input("Intent: ")
+        style = self.get_user_input("Style: ")
+
+        path = self.script_dir / f"brain_{name}.json"
+        try:
+            self._write_json(path, {"intent": intent, "style": style})
+        except OSError as e:
+            print(f"❌ Could not write config: {e}")
+            return
+        self._dir_cache.pop((str(self.script_dir), "brain*.json"), None)
+        self._brain_cache_mtime = None
+        self._get_brain_configs()
+        print(f"✅ Created {path.name}")
+
+    def _edit_brain_config(self):
+        """Edit intent/style of an existing config"""
+        print("\n🧠 EDIT BRAIN CONFIG")
+        name = self._pick_config("Config to edit (Enter to go back): ")
+        if name is None:
+            return
+        path = self.brain_configs[name]
+        try:
+            brain = dict(self._read_json(path))
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read {path.name}: {e}")
+            return
+
+        print(f"📖 Current intent: {brain.get('intent', '')}")
+        intent = self.get_user_input("New intent (Enter keeps current): ")
+        print(f"🎨 Current style: {brain.get('style', '')}")
+        style = self.get_user_input("New style (Enter keeps current): ")
+
+        if intent:
+            brain['intent'] = intent
+        if style:
+            brain['style'] = style
+        try:
+            self._write_json(path, brain)
+        except OSError as e:
+            print(f"❌ Could not write {path.name}: {e}")
+            return
+        print(f"✅ Updated {path.name}")
+
+    def _set_active_config(self):
+        """Copy a config over brain.json so the engines pick it up"""
+        print("\n🧠 SET ACTIVE CONFIG")
+        name = self._pick_config("Config to activate (Enter to go back): ")
+        if name is None:
+            return
+        import shutil
+        try:
+            # copyfile skips the copystat metadata syscalls and takes the
+            # kernel fast path for same-filesystem copies
+            shutil.copyfile(self.brain_configs[name], self.script_dir / "brain.json")
+        except OSError as e:
+            print(f"❌ Could not activate: {e}")
+            return
+        print(f"✅ {name} is now the active brain")
+
+    def _delete_brain_config(self):
+        """Delete a brain_<name>.json"""
+        print("\n🧠 DELETE BRAIN CONFIG")
+        name = self._pick_config("Config to delete (Enter to go back): ")
+        if name is None:
+            return
+        if name == "brain":
+            print("⚠️  Refusing to delete the active brain.json")
+            return
+        confirm = self.get_user_input(f"Delete {name}? [y/N]: ")
+        if confirm.lower() != 'y':
+            return
+        try:
+            self.brain_configs[name].unlink()
+        except OSError as e:
+            print(f"❌ Could not delete: {e}")
+            return
+        self._dir_cache.pop((str(self.script_dir), "brain*.json"), None)
+        self._brain_cache_mtime = None
+        self._get_brain_configs()
+        print(f"✅ Deleted {name}")
+
+    def brain_configuration_manager(self):
+        """Submenu for creating, editing and activating brain configs"""
+        while True:
+            sys.stdout.buffer.write(self._BRAIN_MGR_MENU_BYTES)
+            sys.stdout.flush()
+            choice = self.get_user_input("Choice: ", self._BRAIN_MGR_OPTIONS)
+            if choice == "5":
+                break
+            self._brain_mgr_actions[choice]()
+
+    def _view_configuration(self):
+        """Summarize config.json"""
+        try:
+            config = self._read_json(self.script_dir / "config.json")
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read config.json: {e}")
+            return
+        print("\n⚙️  CURRENT CONFIGURATION")
+        print(f"🤖 Model: {config.get('model', {}).get('name', 'unknown')}")
+        print(f"⏱️  Timeout: {config.get('model', {}).get('timeout', '?')}s")
+        print(f"✨ Symbol pools: {len(config.get('symbols', {}).get('base_pools', {}))}")
+        print(f"🎨 Color palettes: {len(config.get('colors', {}).get('base_palettes', {}))}")
+        print(f"🌟 Themes: {len(config.get('themes', {}))}")
+
+    def _check_dependencies(self):
+        """Verify required files and the Ollama CLI are available"""
+        print("\n🔍 DEPENDENCY CHECK")
+        # One readdir covers every required file instead of a stat each
+        required = ("dream.py", "dream_v2.py", "config.json", "brain.json")
+        try:
+            with os.scandir(self.script_dir) as it:
+                present = {entry.name for entry in it}
+        except OSError:
+            present = set()
+        for name in required:
+            status = "✅" if name in present else "❌"
+            print(f"{status} {name}")
+
+        now = time.monotonic()
+        if self._ollama_status is not None and now - self._ollama_status[0] < 30:
+            status = self._ollama_status[1]
+        else:
+            import subprocess
+            try:
+                result = subprocess.run(
+                    ["ollama", "--version"],
+                    capture_output=True, text=True, timeout=10,
+                    stdin=subprocess.DEVNULL, bufsize=-1)
+                if result.returncode == 0:
+                    status = f"✅ ollama ({result.stdout.strip()})"
+                else:
+                    status = "❌ ollama (error running --version)"
+            except (OSError, subprocess.TimeoutExpired):
+                status = "❌ ollama (not found in PATH)"
+            self._ollama_status = (now, status)
+        print(status)
+        print(f"✅ python {sys.version.split()[0]}")
+
+    def _clear_session_data(self):
+        """Delete accumulated logs and echoes"""
+        confirm = self.get_user_input("Clear all logs and echoes? [y/N]: ")
+        if confirm.lower() != 'y':
+            return
+
+        def _count(directory):
+            try:
+                with os.scandir(directory) as it:
+                    return sum(1 for _ in it)
+            except OSError:
+                return 0
+
+        logs_dir = self.script_dir / "logs"
+        echoes_dir = self.script_dir / "echoes"
+        removed = _count(logs_dir) + _count(echoes_dir)
+        if not removed:
+            print("🧹 Nothing to remove")
+            return
+
+        # One directory-level teardown per tree instead of a glob plus
+        # an unlink syscall and Path object per file
+        import shutil
+        for directory in (logs_dir, echoes_dir):
+            shutil.rmtree(directory, ignore_errors=True)
+            try:
+                directory.mkdir(exist_ok=True)
+            except OSError:
+                pass
+        self._dir_cache.clear()
+        print(f"🧹 Removed {removed} file(s)")
+
+    def _cache_management(self):
+        """Inspect, rebuild or clear the config parse cache"""
+        stats = self.performance_cache.get_stats()
+        print("\n🗃️  CACHE MANAGEMENT")
+        print(f"♻️  Hits: {stats['hits']}  Misses: {stats['misses']}"
+              f"  Hit rate: {stats['hit_rate']}")
+        print(f"📦 Cached parses: {len(self.performance_cache.memory_cache)}")
+        sys.stdout.buffer.write(self._CACHE_MENU_BYTES)
+        sys.stdout.flush()
+        choice = self.get_user_input("Choice: ", self._CACHE_OPTIONS)
+        if choice == "1":
+            configs = self._get_brain_configs()
+
+            def _warm(config_path):
+                try:
+                    self.performance_cache.get_config(config_path)
+                except (OSError, ValueError):
+                    pass
+
+            # The reads release the GIL, so a small pool overlaps them;
+            # the cache itself locks around its inserts
+            if configs:
+                from concurrent.futures import ThreadPoolExecutor
+                workers = min(8, len(configs))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(_warm, configs.values()))
+            print(f"✅ Rebuilt cache for {len(configs)} config(s)")
+        elif choice == "2":
+            self.performance_cache.invalidate_cache()
+            print("🧹 Cache cleared")
+
+    def system_configuration(self):
+        """Submenu for config inspection and maintenance"""
+        while True:
+            sys.stdout.buffer.write(self._SYSTEM_MENU_BYTES)
+            sys.stdout.flush()
+            choice = self.get_user_input("Choice: ", self._SYSTEM_OPTIONS)
+            if choice == "5":
+                break
+            self._system_actions[choice]()
+
+    def display_session_stats(self):
+        """Show counters for this session and on-disk artifacts"""
+        print("\n📊 SESSION STATS")
+        print(f"🔮 Dreams generated: {self.session_stats['dreams_generated']}")
+        bits = self._themes_bits
+        explored = [name for name, i in self._theme_index.items()
+                    if bits >> i & 1]
+        print(f"🎨 Themes explored: {bits.bit_count()}"
+              + (f" ({', '.join(sorted(explored))})" if explored else ""))
+
+        # Counting needs no Path objects, so skip the glob cache and
+        # let scandir tally names directly
+        echo_count = self._count_ext(self.script_dir / "echoes", ".md")
+        log_count = self._count_ext(self.script_dir / "logs", ".log")
+        print(f"🌊 Echo files: {echo_count}")
+        print(f"📋 Log files: {log_count}")
+
+    def display_help(self):
+        """Explain the menu options"""
+        sys.stdout.buffer.write(self._HELP_BYTES)
+        sys.stdout.flush()
+
+    def handle_exit(self):
+        """Print the session summary and stop the loop"""
+        # Duration from the monotonic clock: no datetime arithmetic,
+        # and immune to wall-clock steps mid-session
+        hours, rem = divmod(
+            int(time.monotonic() - self._session_start_monotonic), 3600)
+        minutes, seconds = divmod(rem, 60)
+        sys.stdout.write(
+            "\n🌟 Session summary:\n"
+            f"   ⏱️  Session time: {hours:02d}:{minutes:02d}:{seconds:02d}\n"
+            f"   🔮 Dreams generated: {self.session_stats['dreams_generated']}\n"
+            f"   🎨 Themes explored: {self._themes_bits.bit_count()}\n"
+            "👋 The gate closes. Sweet dreams.\n")
+        sys.stdout.flush()
+        self.running = False
+
+    def run(self):
+        """Main interactive loop"""
+        while self.running:
+            self.clear_screen()
+            self.display_header()
+            self.display_main_menu()
+            choice = self.get_user_input("\nChoice: ", self._MAIN_OPTIONS)
+            self._main_actions[choice]()
+            if self.running:
+                self.get_user_input("\n⏎  Press Enter to continue...")
+
+
+def main():
+    """Main entry point"""
+    gate = MainGate()
+    try:
+        gate.run()
+    except KeyboardInterrupt:
+        # Defense-in-depth if the SIGINT handler was replaced
+        print("\n👋 Leaving the gate...")
+
+
+if __name__ == "__main__":
+    main()
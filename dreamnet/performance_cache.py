@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+performance_cache.py - Shared JSON config cache for the dreamnet tools
+
+Keeps parsed configs in memory, keyed by path and validated against
+the source file's mtime. The sources are small local JSON files, so a
+cold start just re-reads them — no disk tier to go stale.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+
+# Optional: fast JSON parse/encode, same convention as main_gate
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Entry cap: bounds memory when users explore large config collections
+MAX_CACHE = 256
+
+
+class PerformanceCache:
+    """In-memory LRU cache for parsed JSON config files"""
+
+    def __init__(self):
+        self.memory_cache = OrderedDict()
+        self.cache_stats = {'hits': 0, 'misses': 0, 'total_requests': 0}
+        # Hit rate kept incrementally in tenths of a percent, so
+        # get_stats never divides or recounts
+        self._hit_rate_x1000 = 0
+        # get_config may run from worker threads (cache rebuild); the
+        # lock keeps the counters and dict inserts consistent
+        self._lock = threading.Lock()
+
+    def get_config(self, config_path):
+        """Parsed JSON for config_path, cached against its mtime+size
+
+        Repeat lookups collapse to one stat plus one dict probe: the
+        memory tier is keyed by the path string itself with the
+        (mtime_ns, size) stamp stored alongside, so no hashing runs on
+        the hot path and edits that happen to preserve the mtime still
+        invalidate when the size moves.
+        """
+        path_str = str(config_path)
+        st = os.stat(path_str)
+        stamp = (st.st_mtime_ns, st.st_size)
+        stats = self.cache_stats
+
+        entry = self.memory_cache.get(path_str)
+        if entry is not None and entry[0] == stamp:
+            with self._lock:
+                stats['total_requests'] += 1
+                stats['hits'] += 1
+                self._hit_rate_x1000 = stats['hits'] * 1000 // stats['total_requests']
+                if path_str in self.memory_cache:
+                    self.memory_cache.move_to_end(path_str)
+            return entry[1]
+
+        # Parse outside the lock so concurrent misses overlap their I/O
+        with open(path_str, 'rb') as f:
+            data = _json_loads(f.read())
+        with self._lock:
+            stats['total_requests'] += 1
+            stats['misses'] += 1
+            self._hit_rate_x1000 = stats['hits'] * 1000 // stats['total_requests']
+            self.memory_cache[path_str] = (stamp, data)
+            self.memory_cache.move_to_end(path_str)
+            if len(self.memory_cache) > MAX_CACHE:
+                self.memory_cache.popitem(last=False)
+        return data
+
+    def invalidate_cache(self, config_path=None):
+        """Drop one cached config, or everything when no path is given"""
+        if config_path is not None:
+            self.memory_cache.pop(str(config_path), None)
+        else:
+            self.memory_cache.clear()
+
+    def get_stats(self):
+        """Hit/miss counters plus the precomputed hit rate"""
+        stats = self.cache_stats
+        return {'hits': stats['hits'], 'misses': stats['misses'],
+                'hit_rate': f"{self._hit_rate_x1000 / 10:.1f}%"}
@@ -3,11 +3,35 @@
 Test script for dreamnet with different themes
 """
 
+import asyncio
+import hashlib
 import json
 import os
-import shutil
-import time
 import sys
+import tempfile
+
+# Optional: fast JSON parse/encode, same convention as the other tools
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(path):
+    """Parse a JSON file from a single bytes read"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dump_json(path, obj):
+    """Write obj as indented JSON in one bytes write"""
+    if orjson is not None:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(obj, indent=2).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(payload)
 
 # Enhanced test brains with diverse themes
 test_brains = [
@@ -45,59 +69,120 @@ test_brains = [
     }
 ]
 
-def test_theme(brain_data, theme_name):
-    """Test a specific theme configuration"""
-    print(f"\n{'='*60}")
-    print(f"🌟 Testing: {theme_name}")
-    print(f"{'='*60}")
-    print(f"📖 Intent: {brain_data['intent']}")
-    print(f"🎨 Style: {brain_data['style']}")
-    
-    # Get the directory where this script is located
+# Hard cap per dream; a hung model call should not wedge the whole run
+DREAM_TIMEOUT = 120
+
+def _cache_key(brain_data, script_bytes):
+    """Content hash over the brain dict and dream.py itself
+
+    Same brain + same engine = same cache slot; editing either gives a
+    fresh key, so stale results can't survive a code change.
+    """
+    payload = (json.dumps(brain_data, sort_keys=True).encode('utf-8')
+               + script_bytes)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+async def test_theme(brain_data, theme_name, index, work_dir, cache_path):
+    """Test a specific theme configuration; returns its report"""
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    brain_path = os.path.join(script_dir, "brain.json")
-    brain_backup_path = os.path.join(script_dir, "brain_backup.json")
-    output_path = os.path.join(script_dir, "output.json")
     dream_script = os.path.join(script_dir, "dream.py")
-    
-    # Save current brain.json
-    if os.path.exists(brain_path):
-        shutil.copy(brain_path, brain_backup_path)
-    
-    # Write test brain
-    with open(brain_path, 'w') as f:
-        json.dump(brain_data, f, indent=2)
-    
-    # Run dreamnet with proper path
-    print("🔮 Generating...")
-    os.system(f"{sys.executable} {dream_script}")
-    
-    # Small delay to ensure file is written
-    time.sleep(0.5)
-    
-    # Read result
-    try:
-        with open(output_path, 'r', encoding='utf-8') as f:
-            result = json.load(f)
-        
-        print(f"\n✨ Symbol: {result['symbol']}")
-        print(f"📝 Phrase: {result['phrase']}")
-        print(f"🎨 Color: {result.get('color', 'N/A')}")
-        print(f"💭 Reasoning: {result.get('reasoning', 'N/A')[:100]}...")
-    except Exception as e:
-        print(f"❌ Error reading result: {e}")
-    
-    # Restore original brain
-    if os.path.exists(brain_backup_path):
-        shutil.move(brain_backup_path, brain_path)
+
+    # A cached result from an identical brain + engine skips the run
+    result = None
+    cached = False
+    if cache_path and os.path.exists(cache_path):
+        try:
+            result = _load_json(cache_path)
+            cached = True
+        except (OSError, ValueError):
+            result = None
+
+    error = None
+    if result is None:
+        # Per-theme brain and output files, so concurrent runs never
+        # touch the canonical brain.json or race on a shared output.json
+        brain_path = os.path.join(work_dir, f"brain_{index}.json")
+        output_path = os.path.join(work_dir, f"output_{index}.json")
+        _dump_json(brain_path, brain_data)
+
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, dream_script,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            env={**os.environ,
+                 "DREAMNET_BRAIN": brain_path,
+                 "DREAMNET_OUTPUT": output_path})
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=DREAM_TIMEOUT)
+        except asyncio.TimeoutError:
+            # wait_for cancels our waiter but not the child — kill it
+            # and reap, or the stuck dream.py lingers as a zombie
+            proc.kill()
+            await proc.wait()
+            print(f"⏱️  {theme_name} timed out after {DREAM_TIMEOUT}s")
+
+        try:
+            result = _load_json(output_path)
+        except Exception as e:
+            error = e
+
+        if result is not None and cache_path:
+            try:
+                _dump_json(cache_path, result)
+            except OSError:
+                pass
+
+    report = [
+        f"\n{'='*60}",
+        f"🌟 Testing: {theme_name}" + (" ♻️  (cached)" if cached else ""),
+        f"{'='*60}",
+        f"📖 Intent: {brain_data['intent']}",
+        f"🎨 Style: {brain_data['style']}",
+    ]
+    if result is not None:
+        report.append(f"\n✨ Symbol: {result['symbol']}")
+        report.append(f"📝 Phrase: {result['phrase']}")
+        report.append(f"🎨 Color: {result.get('color', 'N/A')}")
+        report.append(f"💭 Reasoning: {result.get('reasoning', 'N/A')[:100]}...")
+    else:
+        report.append(f"❌ Error reading result: {error}")
+    return "\n".join(report)
+
+async def main_async():
+    """Dream every theme concurrently, then report in order"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Result cache keyed by brain+engine content; --no-cache forces
+    # every theme to dream fresh
+    cache_dir = None
+    script_bytes = b""
+    if "--no-cache" not in sys.argv:
+        cache_dir = os.path.join(script_dir, "cache", "themes")
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(os.path.join(script_dir, "dream.py"), 'rb') as f:
+            script_bytes = f.read()
+
+    def cache_path_for(brain):
+        if cache_dir is None:
+            return None
+        return os.path.join(cache_dir,
+                            f"{_cache_key(brain, script_bytes)}.json")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        reports = await asyncio.gather(*(
+            test_theme(brain, f"Theme {i+1}: {brain['intent'][:30]}...",
+                       i, work_dir, cache_path_for(brain))
+            for i, brain in enumerate(test_brains)))
+    for report in reports:
+        print(report)
 
 if __name__ == "__main__":
     print("🌙 Dreamnet Theme Tester")
     print("Testing enhanced symbolic generation across multiple themes...")
-    
-    for i, brain in enumerate(test_brains):
-        test_theme(brain, f"Theme {i+1}: {brain['intent'][:30]}...")
-    
+    print(f"🔮 Generating {len(test_brains)} dreams concurrently...")
+
+    asyncio.run(main_async())
+
     print(f"\n{'='*60}")
     print("🌟 Theme testing complete!")
     print(f"{'='*60}")